@@ -4,6 +4,8 @@ Phase 1 Task 3: Consolidated from duplicated create_all_assessors() functions
 across CLI modules (main.py, assess_batch.py, demo.py).
 """
 
+from functools import lru_cache
+
 from .base import BaseAssessor
 from .code_quality import (
     CodeSmellsAssessor,
@@ -50,11 +52,19 @@ def create_all_assessors() -> list[BaseAssessor]:
     """Create all 25 assessors for assessment.
 
     Centralized factory function to eliminate duplication across CLI commands.
-    Returns all implemented and stub assessors.
+    Returns all implemented and stub assessors. Assessors keep no per-repository
+    state, so the instances are built once and shared; each call returns a new
+    list that callers may filter or reorder freely.
 
     Returns:
         List of all assessor instances
     """
+    return list(_build_all_assessors())
+
+
+@lru_cache(maxsize=1)
+def _build_all_assessors() -> tuple[BaseAssessor, ...]:
+    """Instantiate every assessor once per process."""
     assessors = [
         # Tier 1 Essential (6 assessors - up from 5)
         CLAUDEmdAssessor(),
@@ -90,4 +100,4 @@ def create_all_assessors() -> list[BaseAssessor]:
     # Add remaining stub assessors (currently none - all implemented or removed)
     assessors.extend(create_stub_assessors())
 
-    return assessors
+    return tuple(assessors)
@@ -13,6 +13,27 @@ from ..models.repository import Repository
 from ..utils.subprocess_utils import safe_subprocess_run
 from .base import BaseAssessor
 
+# Fields holding nested statement lists, per AST node type. Functions and
+# classes are statements, so following only these fields reaches every
+# definition without visiting expressions the way ast.walk() does.
+_STMT_LIST_FIELDS: dict[type, tuple[str, ...]] = {
+    ast.Module: ("body",),
+    ast.FunctionDef: ("body",),
+    ast.AsyncFunctionDef: ("body",),
+    ast.ClassDef: ("body",),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.If: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+    ast.Try: ("body", "handlers", "orelse", "finalbody"),
+    ast.TryStar: ("body", "handlers", "orelse", "finalbody"),
+    ast.ExceptHandler: ("body",),
+    ast.Match: ("cases",),
+    ast.match_case: ("body",),
+}
+
 
 class CLAUDEmdAssessor(BaseAssessor):
     """Assesses presence and quality of CLAUDE.md configuration file.
@@ -374,12 +395,12 @@ class READMEAssessor(BaseAssessor):
         Pass criteria: README.md exists with essential sections
         Scoring: Proportional based on section count
         """
-        readme_path = repository.path / "README.md"
-
         # Fix TOCTOU: Use try-except around file read instead of existence check
         try:
-            with open(readme_path, "r", encoding="utf-8") as f:
-                content = f.read().lower()
+            readme_text = repository.readme_text
+            if readme_text is None:
+                raise FileNotFoundError("README.md")
+            content = readme_text.lower()
 
             required_sections = {
                 "installation": any(
@@ -780,20 +801,18 @@ class ConciseDocumentationAssessor(BaseAssessor):
         - Markdown structure (40%): Heading density (target 3-5 per 100 lines)
         - Concise formatting (30%): Bullet points, code blocks, no walls of text
         """
-        readme_path = repository.path / "README.md"
-
-        if not readme_path.exists():
-            return Finding.not_applicable(
-                self.attribute, reason="No README.md found in repository"
-            )
-
         try:
-            content = readme_path.read_text(encoding="utf-8")
+            content = repository.readme_text
         except (OSError, UnicodeDecodeError) as e:
             return Finding.error(
                 self.attribute, reason=f"Could not read README.md: {e}"
             )
 
+        if content is None:
+            return Finding.not_applicable(
+                self.attribute, reason="No README.md found in repository"
+            )
+
         # Analyze README
         lines = content.splitlines()
         line_count = len(lines)
@@ -1096,29 +1115,14 @@ class InlineDocumentationAssessor(BaseAssessor):
 
                 # Parse the file with AST
                 tree = ast.parse(content, filename=str(file_path))
-
-                # Check module-level docstring
-                module_doc = ast.get_docstring(tree)
-                if module_doc:
-                    documented_items += 1
-                total_public_items += 1
-
-                # Walk the AST and count functions/classes with docstrings
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        # Skip private functions/classes (starting with _)
-                        if node.name.startswith("_"):
-                            continue
-
-                        total_public_items += 1
-                        docstring = ast.get_docstring(node)
-                        if docstring:
-                            documented_items += 1
-
             except (OSError, UnicodeDecodeError, SyntaxError):
                 # Skip files that can't be read or parsed
                 continue
 
+            documented, total = self._count_docstrings(tree)
+            documented_items += documented
+            total_public_items += total
+
         if total_public_items == 0:
             return Finding.not_applicable(
                 self.attribute,
@@ -1126,6 +1130,7 @@ class InlineDocumentationAssessor(BaseAssessor):
             )
 
         coverage_percent = (documented_items / total_public_items) * 100
+        coverage_display = f"{coverage_percent:.1f}%"
         score = self.calculate_proportional_score(
             measured_value=coverage_percent,
             threshold=80.0,
@@ -1137,7 +1142,7 @@ class InlineDocumentationAssessor(BaseAssessor):
         # Build evidence
         evidence = [
             f"Documented items: {documented_items}/{total_public_items}",
-            f"Coverage: {coverage_percent:.1f}%",
+            f"Coverage: {coverage_display}",
         ]
 
         if coverage_percent >= 80:
@@ -1151,13 +1156,61 @@ class InlineDocumentationAssessor(BaseAssessor):
             attribute=self.attribute,
             status=status,
             score=score,
-            measured_value=f"{coverage_percent:.1f}%",
+            measured_value=coverage_display,
             threshold="≥80%",
             evidence=evidence,
             remediation=self._create_remediation() if status == "fail" else None,
             error_message=None,
         )
 
+    def _count_docstrings(self, tree: ast.Module) -> tuple[int, int]:
+        """Count documented and total public items in a parsed module.
+
+        The module itself always counts as one public item; functions and
+        classes whose names start with ``_`` are skipped.
+
+        Returns:
+            Tuple of (documented_items, total_public_items)
+        """
+        has_docstring = self._has_docstring
+        documented = 1 if has_docstring(tree) else 0
+        total = 1
+
+        function_def = ast.FunctionDef
+        class_def = ast.ClassDef
+        stmt_fields = _STMT_LIST_FIELDS.get
+        stack = list(tree.body)
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            for field in stmt_fields(node_type, ()):
+                stack.extend(getattr(node, field))
+            if node_type is not function_def and node_type is not class_def:
+                continue
+            if node.name.startswith("_"):
+                continue
+            total += 1
+            if has_docstring(node):
+                documented += 1
+
+        return documented, total
+
+    def _has_docstring(self, node: ast.AST) -> bool:
+        """Check for a non-blank docstring without building it.
+
+        Stands in for ``bool(ast.get_docstring(node))`` but skips the
+        ``inspect.cleandoc`` pass, since only presence matters here.
+        Whitespace-only docstrings count as missing.
+        """
+        body = node.body
+        if not body or not isinstance(body[0], ast.Expr):
+            return False
+        value = body[0].value
+        if not isinstance(value, ast.Constant) or not isinstance(value.value, str):
+            return False
+        # Blank docstrings clean down to "" and don't count
+        return bool(value.value) and not value.value.isspace()
+
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for missing docstrings."""
         return Remediation(
@@ -1249,6 +1302,11 @@ class OpenAPISpecsAssessor(BaseAssessor):
     enables AI to generate client code, tests, and integration code.
     """
 
+    # Spec files under these directories are vendored or generated
+    EXCLUDED_DIRS = frozenset(
+        {".git", "node_modules", ".venv", "venv", "__pycache__", ".pytest_cache"}
+    )
+
     @property
     def attribute_id(self) -> str:
         return "openapi_specs"
@@ -1334,25 +1392,13 @@ class OpenAPISpecsAssessor(BaseAssessor):
 
         # Recursively search for spec files
         found_specs = []
-        excluded_dirs = {
-            ".git",
-            "node_modules",
-            ".venv",
-            "venv",
-            "__pycache__",
-            ".pytest_cache",
-        }
 
         for spec_name in spec_files:
             try:
                 # Use rglob to search recursively
                 matches = list(repository.path.rglob(spec_name))
                 # Filter out files in excluded directories
-                matches = [
-                    m
-                    for m in matches
-                    if not any(part in m.parts for part in excluded_dirs)
-                ]
+                matches = [m for m in matches if self.EXCLUDED_DIRS.isdisjoint(m.parts)]
                 found_specs.extend(matches)
             except OSError:
                 # If rglob fails, continue to next pattern
@@ -1388,30 +1434,22 @@ class OpenAPISpecsAssessor(BaseAssessor):
                 error_message=None,
             )
 
-        # Parse the spec file
+        # Collect version/path/schema counts without building the document
         try:
-            content = found_spec.read_text(encoding="utf-8")
-
-            # Try YAML first, then JSON
             try:
-                spec_data = yaml.safe_load(content)
-            except yaml.YAMLError:
-                try:
-                    spec_data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    spec_relative_path = found_spec.relative_to(repository.path)
-                    return Finding.error(
-                        self.attribute,
-                        reason=f"Could not parse {spec_relative_path}: {str(e)}",
-                    )
+                stats = self._quick_openapi_stats(found_spec)
+            except (yaml.YAMLError, json.JSONDecodeError) as e:
+                spec_relative_path = found_spec.relative_to(repository.path)
+                return Finding.error(
+                    self.attribute,
+                    reason=f"Could not parse {spec_relative_path}: {str(e)}",
+                )
 
-            # Extract version and check completeness
-            openapi_version = spec_data.get("openapi", spec_data.get("swagger"))
-            has_paths = "paths" in spec_data and len(spec_data["paths"]) > 0
-            has_schemas = (
-                "components" in spec_data
-                and "schemas" in spec_data.get("components", {})
-            ) or ("definitions" in spec_data)
+            openapi_version = stats["version"]
+            path_count = stats["path_count"]
+            schema_count = stats["schema_count"]
+            has_paths = path_count > 0
+            has_schemas = schema_count is not None
 
             # Calculate score
             file_score = 60  # File exists
@@ -1456,14 +1494,9 @@ class OpenAPISpecsAssessor(BaseAssessor):
                 evidence.append(f"OpenAPI version: {openapi_version}")
 
             if has_paths:
-                path_count = len(spec_data["paths"])
                 evidence.append(f"{path_count} endpoints documented")
 
             if has_schemas:
-                if "components" in spec_data:
-                    schema_count = len(spec_data["components"].get("schemas", {}))
-                else:
-                    schema_count = len(spec_data.get("definitions", {}))
                 evidence.append(f"{schema_count} schemas defined")
 
             return Finding(
@@ -1485,6 +1518,152 @@ class OpenAPISpecsAssessor(BaseAssessor):
                 self.attribute, reason=f"Could not read {spec_relative_path}: {str(e)}"
             )
 
+    def _quick_openapi_stats(self, spec_path: Path) -> dict:
+        """Count version, paths and schemas of an OpenAPI spec.
+
+        JSON specs go through the C-accelerated ``json`` decoder. YAML specs
+        are walked at the event level with ``yaml.parse`` so nested operation
+        and schema bodies are skipped instead of being constructed, and the
+        walk stops as soon as every top-level key of interest has been seen.
+
+        Returns:
+            Dict with ``version`` (str or None), ``path_count`` (int) and
+            ``schema_count`` (int, or None when no schemas section exists)
+        """
+        if spec_path.suffix == ".json":
+            with open(spec_path, "r", encoding="utf-8") as f:
+                spec_data = json.load(f)
+            return self._stats_from_spec_data(spec_data)
+
+        with open(spec_path, "r", encoding="utf-8") as f:
+            return self._stats_from_yaml_events(yaml.parse(f, Loader=yaml.SafeLoader))
+
+    def _stats_from_spec_data(self, spec_data) -> dict:
+        """Compute OpenAPI stats from an already-decoded spec."""
+        stats = {"version": None, "path_count": 0, "schema_count": None}
+        if not isinstance(spec_data, dict):
+            return stats
+
+        version = spec_data.get("openapi", spec_data.get("swagger"))
+        stats["version"] = str(version) if version is not None else None
+
+        paths = spec_data.get("paths")
+        if isinstance(paths, dict):
+            stats["path_count"] = len(paths)
+
+        components = spec_data.get("components")
+        if isinstance(components, dict) and "schemas" in components:
+            schemas = components["schemas"]
+            stats["schema_count"] = len(schemas) if isinstance(schemas, dict) else 0
+        elif "definitions" in spec_data:
+            definitions = spec_data["definitions"]
+            stats["schema_count"] = (
+                len(definitions) if isinstance(definitions, dict) else 0
+            )
+
+        return stats
+
+    def _stats_from_yaml_events(self, events) -> dict:
+        """Compute OpenAPI stats from a ``yaml.parse`` event stream."""
+        stats = {"version": None, "path_count": 0, "schema_count": None}
+        events = iter(events)
+
+        # Advance to the root node; anything but a mapping has no stats
+        for event in events:
+            if isinstance(event, yaml.MappingStartEvent):
+                break
+            if isinstance(event, yaml.NodeEvent):
+                return stats
+        else:
+            return stats
+
+        openapi_version = None
+        swagger_version = None
+        seen_paths = False
+        component_schemas = None
+        definitions = None
+
+        for key in events:
+            if isinstance(key, yaml.MappingEndEvent):
+                break
+            self._skip_yaml_node(events, key)
+            value = next(events)
+            name = key.value if isinstance(key, yaml.ScalarEvent) else None
+
+            if name in ("openapi", "swagger") and isinstance(value, yaml.ScalarEvent):
+                if name == "openapi":
+                    openapi_version = value.value
+                else:
+                    swagger_version = value.value
+            elif name == "paths":
+                seen_paths = True
+                stats["path_count"] = self._count_yaml_mapping_keys(events, value)
+            elif name == "definitions":
+                definitions = self._count_yaml_mapping_keys(events, value)
+            elif name == "components" and isinstance(value, yaml.MappingStartEvent):
+                component_schemas = self._count_component_schemas(events)
+            else:
+                self._skip_yaml_node(events, value)
+
+            if (
+                openapi_version is not None
+                and seen_paths
+                and component_schemas is not None
+            ):
+                # Nothing left that could change the result
+                break
+
+        stats["version"] = (
+            openapi_version if openapi_version is not None else swagger_version
+        )
+        stats["schema_count"] = (
+            component_schemas if component_schemas is not None else definitions
+        )
+        return stats
+
+    def _count_component_schemas(self, events) -> int | None:
+        """Count ``components.schemas`` entries, consuming the components node."""
+        schema_count = None
+        for key in events:
+            if isinstance(key, yaml.MappingEndEvent):
+                break
+            self._skip_yaml_node(events, key)
+            value = next(events)
+            if isinstance(key, yaml.ScalarEvent) and key.value == "schemas":
+                schema_count = self._count_yaml_mapping_keys(events, value)
+            else:
+                self._skip_yaml_node(events, value)
+        return schema_count
+
+    def _count_yaml_mapping_keys(self, events, start) -> int:
+        """Count the keys of the mapping opened by ``start`` and consume it."""
+        if not isinstance(start, yaml.MappingStartEvent):
+            self._skip_yaml_node(events, start)
+            return 0
+
+        count = 0
+        for key in events:
+            if isinstance(key, yaml.MappingEndEvent):
+                break
+            self._skip_yaml_node(events, key)
+            self._skip_yaml_node(events, next(events))
+            count += 1
+        return count
+
+    def _skip_yaml_node(self, events, start) -> None:
+        """Consume the events of the collection opened by ``start``, if any."""
+        if not isinstance(start, yaml.CollectionStartEvent):
+            return
+
+        depth = 1
+        for event in events:
+            if isinstance(event, yaml.CollectionStartEvent):
+                depth += 1
+            elif isinstance(event, yaml.CollectionEndEvent):
+                depth -= 1
+                if depth == 0:
+                    return
+
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for OpenAPI specs."""
         return Remediation(
@@ -1,10 +1,13 @@
 """Security assessors for dependency scanning, SAST, and secret detection."""
 
+import os
+
 import yaml
 
 from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
 from ..models.repository import Repository
+from ..utils.manifest_cache import load_package_json, read_manifest_text
 from .base import BaseAssessor
 
 
@@ -41,16 +44,24 @@ class DependencySecurityAssessor(BaseAssessor):
         evidence = []
         tools_found = []
 
+        # Root and .github/ probes are answered from the repository's cached
+        # directory listings rather than one stat() per candidate file
+        root_entries = repository.root_dir_entries
+        github_dir = os.path.join(repository.path_str, ".github")
+        github_entries = repository.fs.listdir(github_dir)
+        workflow_names = repository.fs.listdir(os.path.join(github_dir, "workflows"))
+
         # 1. Dependabot configuration (30 points)
-        dependabot_config = repository.path / ".github" / "dependabot.yml"
-        if dependabot_config.exists():
+        dependabot_config = github_entries.get("dependabot.yml")
+        if dependabot_config is not None:
             score += 30
             tools_found.append("Dependabot")
             evidence.append("✓ Dependabot configured for dependency alerts")
 
             # Bonus: Check if updates are scheduled
             try:
-                config = yaml.safe_load(dependabot_config.read_text())
+                with open(dependabot_config.path, encoding="utf-8") as f:
+                    config = yaml.safe_load(f)
                 if config and "updates" in config and len(config["updates"]) > 0:
                     score += 5
                     evidence.append(
@@ -60,23 +71,18 @@ class DependencySecurityAssessor(BaseAssessor):
                 pass
 
         # 2. CodeQL / GitHub Security Scanning (25 points)
-        codeql_workflow = repository.path / ".github" / "workflows"
-        if codeql_workflow.exists():
-            codeql_files = list(codeql_workflow.glob("*codeql*.yml")) + list(
-                codeql_workflow.glob("*codeql*.yaml")
-            )
-            if codeql_files:
-                score += 25
-                tools_found.append("CodeQL")
-                evidence.append("✓ CodeQL security scanning configured")
+        if self._has_workflow(workflow_names, "codeql"):
+            score += 25
+            tools_found.append("CodeQL")
+            evidence.append("✓ CodeQL security scanning configured")
 
         # 3. Python dependency scanners (20 points)
         if "Python" in repository.languages:
             # Check for pip-audit, safety, or bandit
-            pyproject = repository.path / "pyproject.toml"
-            if pyproject.exists():
+            pyproject = os.path.join(repository.path_str, "pyproject.toml")
+            if "pyproject.toml" in root_entries:
                 try:
-                    content = pyproject.read_text()
+                    content = read_manifest_text(pyproject)
                     if "pip-audit" in content or "safety" in content:
                         score += 10
                         tools_found.append("pip-audit/safety")
@@ -87,9 +93,9 @@ class DependencySecurityAssessor(BaseAssessor):
                     pass
 
             # Check for Bandit (SAST)
-            if pyproject.exists():
+            if "pyproject.toml" in root_entries:
                 try:
-                    content = pyproject.read_text()
+                    content = read_manifest_text(pyproject)
                     if "bandit" in content:
                         score += 10
                         tools_found.append("Bandit")
@@ -98,38 +104,39 @@ class DependencySecurityAssessor(BaseAssessor):
                     pass
 
         # 4. JavaScript/TypeScript dependency scanners (20 points)
-        if "JavaScript" in repository.languages or "TypeScript" in repository.languages:
-            package_json = repository.path / "package.json"
-            if package_json.exists():
-                try:
-                    import json
-
-                    pkg = json.loads(package_json.read_text())
-                    scripts = pkg.get("scripts", {})
+        if (
+            "JavaScript" in repository.languages or "TypeScript" in repository.languages
+        ) and "package.json" in root_entries:
+            try:
+                pkg = load_package_json(
+                    os.path.join(repository.path_str, "package.json")
+                )
+                scripts = pkg.get("scripts", {})
 
-                    # Check for npm audit or yarn audit in scripts
-                    if any("audit" in str(v) for v in scripts.values()):
-                        score += 10
-                        tools_found.append("npm/yarn audit")
-                        evidence.append("✓ npm/yarn audit configured")
+                # Check for npm audit or yarn audit in scripts
+                if any("audit" in str(v) for v in scripts.values()):
+                    score += 10
+                    tools_found.append("npm/yarn audit")
+                    evidence.append("✓ npm/yarn audit configured")
 
-                    # Check for Snyk
-                    deps = {
-                        **pkg.get("dependencies", {}),
-                        **pkg.get("devDependencies", {}),
-                    }
-                    if "snyk" in deps:
-                        score += 10
-                        tools_found.append("Snyk")
-                        evidence.append("✓ Snyk security scanning configured")
-                except Exception:
-                    pass
+                # Check for Snyk
+                deps = {
+                    **pkg.get("dependencies", {}),
+                    **pkg.get("devDependencies", {}),
+                }
+                if "snyk" in deps:
+                    score += 10
+                    tools_found.append("Snyk")
+                    evidence.append("✓ Snyk security scanning configured")
+            except Exception:
+                pass
 
         # 5. Secret detection in pre-commit (20 points)
-        precommit_config = repository.path / ".pre-commit-config.yaml"
-        if precommit_config.exists():
+        precommit_config = root_entries.get(".pre-commit-config.yaml")
+        if precommit_config is not None:
             try:
-                content = precommit_config.read_text()
+                with open(precommit_config.path, encoding="utf-8") as f:
+                    content = f.read()
                 secret_tools = ["detect-secrets", "gitleaks", "truffleHog"]
                 found_secret_tools = [tool for tool in secret_tools if tool in content]
 
@@ -143,24 +150,17 @@ class DependencySecurityAssessor(BaseAssessor):
                 pass
 
         # 6. Semgrep (multi-language SAST) (15 points)
-        semgrep_config = repository.path / ".semgrep.yml"
-        semgrep_workflow = repository.path / ".github" / "workflows"
-        if semgrep_config.exists():
+        if ".semgrep.yml" in root_entries:
             score += 15
             tools_found.append("Semgrep")
             evidence.append("✓ Semgrep SAST configured")
-        elif semgrep_workflow.exists():
-            semgrep_files = list(semgrep_workflow.glob("*semgrep*.yml")) + list(
-                semgrep_workflow.glob("*semgrep*.yaml")
-            )
-            if semgrep_files:
-                score += 15
-                tools_found.append("Semgrep")
-                evidence.append("✓ Semgrep SAST in GitHub Actions")
+        elif self._has_workflow(workflow_names, "semgrep"):
+            score += 15
+            tools_found.append("Semgrep")
+            evidence.append("✓ Semgrep SAST in GitHub Actions")
 
         # 7. Security policy (5 points bonus)
-        security_md = repository.path / "SECURITY.md"
-        if security_md.exists():
+        if "SECURITY.md" in root_entries:
             score += 5
             evidence.append("✓ SECURITY.md present (vulnerability disclosure policy)")
 
@@ -261,3 +261,11 @@ class DependencySecurityAssessor(BaseAssessor):
             remediation=remediation,
             error_message=None,
         )
+
+    @staticmethod
+    def _has_workflow(workflow_entries: dict, tool: str) -> bool:
+        """Check for a *<tool>*.yml or *<tool>*.yaml workflow file."""
+        return any(
+            tool in name and name.endswith((".yml", ".yaml"))
+            for name in workflow_entries
+        )
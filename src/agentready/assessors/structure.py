@@ -1,6 +1,10 @@
 """Structure assessors for project layout and separation of concerns."""
 
+import os
 import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar
 
 from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
@@ -14,6 +18,16 @@ class StandardLayoutAssessor(BaseAssessor):
     Tier 1 Essential (10% weight) - Standard layouts help AI navigate code.
     """
 
+    ATTRIBUTE = Attribute(
+        id="standard_layout",
+        name="Standard Project Layouts",
+        category="Repository Structure",
+        tier=1,
+        description="Follows standard project structure for language",
+        criteria="Standard directories (src/, tests/, docs/) present",
+        default_weight=0.10,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "standard_layout"
@@ -24,15 +38,7 @@ class StandardLayoutAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="Standard Project Layouts",
-            category="Repository Structure",
-            tier=self.tier,
-            description="Follows standard project structure for language",
-            criteria="Standard directories (src/, tests/, docs/) present",
-            default_weight=0.10,
-        )
+        return self.ATTRIBUTE
 
     def assess(self, repository: Repository) -> Finding:
         """Check for standard project layout directories.
@@ -42,19 +48,12 @@ class StandardLayoutAssessor(BaseAssessor):
         - JavaScript: src/, test/, docs/
         - Java: src/main/java, src/test/java
         """
-        # Check for common standard directories
-        standard_dirs = {
-            "src": repository.path / "src",
-        }
+        top_level_dirs = repository.top_level_dirs
+        has_src = "src" in top_level_dirs
+        has_tests = "tests" in top_level_dirs or "test" in top_level_dirs
 
-        # Check for tests directory (either tests/ or test/)
-        tests_path = repository.path / "tests"
-        if not tests_path.exists():
-            tests_path = repository.path / "test"
-        standard_dirs["tests"] = tests_path
-
-        found_dirs = sum(1 for d in standard_dirs.values() if d.exists())
-        required_dirs = len(standard_dirs)
+        found_dirs = has_src + has_tests
+        required_dirs = 2
 
         score = self.calculate_proportional_score(
             measured_value=found_dirs,
@@ -66,8 +65,8 @@ class StandardLayoutAssessor(BaseAssessor):
 
         evidence = [
             f"Found {found_dirs}/{required_dirs} standard directories",
-            f"src/: {'✓' if (repository.path / 'src').exists() else '✗'}",
-            f"tests/: {'✓' if (repository.path / 'tests').exists() or (repository.path / 'test').exists() else '✗'}",
+            f"src/: {'✓' if has_src else '✗'}",
+            f"tests/: {'✓' if has_tests else '✗'}",
         ]
 
         return Finding(
@@ -117,6 +116,66 @@ class OneCommandSetupAssessor(BaseAssessor):
     reproduce environments and reduces onboarding friction.
     """
 
+    # Common setup commands, optionally at the start of a code fence. The
+    # "install" branch ("<tool> install|setup") takes priority over the
+    # "tool" branch ("<known tool> <subcommand>") anywhere in the README.
+    # The command sits in a lookahead so a match never consumes the next
+    # line, letting finditer() try every line start once.
+    SETUP_COMMAND_PATTERN = re.compile(
+        r"(?:^|\n)(?=(?:```(?:bash|sh|shell)?\n)?"
+        r"(?:(?P<install>[a-z\-_]+\s+(?:install|setup))"
+        r"|(?P<tool>(?:make|npm|yarn|pnpm|pip|poetry|uv|cargo|go)\s+[a-z\-_]+)))",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+    # Literal setup commands per detected language, looked up at line starts
+    # (case-insensitively, like SETUP_COMMAND_PATTERN) before falling back to
+    # the pattern. Each one is also matched by the pattern, so a hit never
+    # changes the score.
+    LANGUAGE_SETUP_COMMANDS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "Python": (
+            "pip install",
+            "poetry install",
+            "uv sync",
+            "make setup",
+            "make install",
+        ),
+        "JavaScript": ("npm install", "yarn install", "pnpm install"),
+        "TypeScript": ("npm install", "yarn install", "pnpm install"),
+        "Go": ("go mod download", "make setup"),
+        "Rust": ("cargo build", "make setup"),
+    }
+    LANGUAGE_SETUP_PATTERNS: ClassVar[dict[str, re.Pattern]] = {
+        language: re.compile(
+            "^(?:" + "|".join(map(re.escape, commands)) + ")",
+            re.IGNORECASE | re.MULTILINE,
+        )
+        for language, commands in LANGUAGE_SETUP_COMMANDS.items()
+    }
+
+    # Markdown level-2+ header boundary used to split README sections
+    SECTION_SPLIT_PATTERN = re.compile(r"\n##\s+")
+
+    # Words that mark setup instructions, matched in one case-insensitive
+    # pass ("install" also covers "installation")
+    SETUP_KEYWORD_PATTERN = re.compile(
+        r"install|setup|quick start|getting started", re.IGNORECASE
+    )
+
+    # Setup instructions live near the top of a README, so only this many
+    # leading bytes are decoded and scanned
+    README_SCAN_BYTES = 32768
+
+    ATTRIBUTE = Attribute(
+        id="one_command_setup",
+        name="One-Command Build/Setup",
+        category="Build & Development",
+        tier=2,
+        description="Single command to set up development environment from fresh clone",
+        criteria="Single command (make setup, npm install, etc.) documented prominently",
+        default_weight=0.03,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "one_command_setup"
@@ -127,15 +186,7 @@ class OneCommandSetupAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="One-Command Build/Setup",
-            category="Build & Development",
-            tier=self.tier,
-            description="Single command to set up development environment from fresh clone",
-            criteria="Single command (make setup, npm install, etc.) documented prominently",
-            default_weight=0.03,
-        )
+        return self.ATTRIBUTE
 
     def assess(self, repository: Repository) -> Finding:
         """Check for single-command setup documentation and tooling.
@@ -145,20 +196,10 @@ class OneCommandSetupAssessor(BaseAssessor):
         - Setup script/Makefile exists (30%)
         - Setup in prominent location (30%)
         """
-        # Check if README exists
-        readme_path = repository.path / "README.md"
-        if not readme_path.exists():
-            return Finding.not_applicable(
-                self.attribute,
-                reason="No README found, cannot assess setup documentation",
-            )
-
-        score = 0
-        evidence = []
-
-        # Read README
+        # Read README (shared with the other README assessors), decoding
+        # only the head that setup instructions are expected in
         try:
-            readme_content = readme_path.read_text()
+            readme_bytes = repository.readme_bytes
         except Exception as e:
             return Finding(
                 attribute=self.attribute,
@@ -171,6 +212,22 @@ class OneCommandSetupAssessor(BaseAssessor):
                 error_message=str(e),
             )
 
+        if readme_bytes is None:
+            return Finding.not_applicable(
+                self.attribute,
+                reason="No README found, cannot assess setup documentation",
+            )
+
+        readme_content = (
+            readme_bytes[: self.README_SCAN_BYTES]
+            .decode("utf-8", errors="replace")
+            .replace("\r\n", "\n")
+            .replace("\r", "\n")
+        )
+
+        score = 0
+        evidence = []
+
         # Check 1: README has setup command (40%)
         setup_command = self._find_setup_command(readme_content, repository.languages)
         if setup_command:
@@ -212,18 +269,38 @@ class OneCommandSetupAssessor(BaseAssessor):
 
         Returns the setup command if found, empty string otherwise.
         """
-        # Common setup patterns by language
-        patterns = [
-            r"(?:^|\n)(?:```(?:bash|sh|shell)?\n)?([a-z\-_]+\s+(?:install|setup))",
-            r"(?:^|\n)(?:```(?:bash|sh|shell)?\n)?((?:make|npm|yarn|pnpm|pip|poetry|uv|cargo|go)\s+[a-z\-_]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, readme_content, re.IGNORECASE | re.MULTILINE)
-            if match:
-                return match.group(1).strip()
+        literal_command = self._find_literal_setup_command(readme_content, languages)
+        if literal_command:
+            return literal_command
+
+        # Single pass: return the first "install" match, otherwise the
+        # first "tool" match seen along the way
+        tool_command = ""
+        for match in self.SETUP_COMMAND_PATTERN.finditer(readme_content):
+            install_command = match.group("install")
+            if install_command:
+                return install_command.strip()
+            if not tool_command:
+                tool_command = match.group("tool").strip()
+
+        return tool_command
+
+    def _find_literal_setup_command(self, readme_content: str, languages: dict) -> str:
+        """Find the earliest known setup command for the repository's languages.
+
+        Returns the command as written in the README if one starts a line,
+        empty string otherwise.
+        """
+        best_match = None
+        for language in languages:
+            pattern = self.LANGUAGE_SETUP_PATTERNS.get(language)
+            if pattern is None:
+                continue
+            match = pattern.search(readme_content)
+            if match and (best_match is None or match.start() < best_match.start()):
+                best_match = match
 
-        return ""
+        return best_match.group(0) if best_match else ""
 
     def _check_setup_files(self, repository: Repository) -> list:
         """Check for setup automation files."""
@@ -239,29 +316,28 @@ class OneCommandSetupAssessor(BaseAssessor):
             "setup.py": "Python setup",
         }
 
+        # One shared root listing answers all probes without extra stats
+        root_entries = repository.root_dir_entries
         for filename, description in files_to_check.items():
-            if (repository.path / filename).exists():
+            if filename in root_entries:
                 setup_files.append(filename)
 
         return setup_files
 
     def _is_setup_prominent(self, readme_content: str) -> bool:
         """Check if setup instructions are in first 3 sections of README."""
-        # Split by markdown headers (## or ###)
-        sections = re.split(r"\n##\s+", readme_content)
-
-        # Check first 3 sections (plus preamble)
-        first_sections = "\n".join(sections[:4])
-
-        setup_keywords = [
-            "install",
-            "setup",
-            "quick start",
-            "getting started",
-            "installation",
-        ]
-
-        return any(keyword in first_sections.lower() for keyword in setup_keywords)
+        # The preamble and first 3 sections end where the 4th header starts;
+        # stop scanning there instead of splitting the whole README
+        prefix_end = len(readme_content)
+        headers = self.SECTION_SPLIT_PATTERN.finditer(readme_content)
+        for header_number, header in enumerate(headers, start=1):
+            if header_number == 4:
+                prefix_end = header.start()
+                break
+
+        return (
+            self.SETUP_KEYWORD_PATTERN.search(readme_content, 0, prefix_end) is not None
+        )
 
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for one-command setup."""
@@ -316,6 +392,16 @@ class IssuePRTemplatesAssessor(BaseAssessor):
     when creating issues/PRs and ensure consistent formatting.
     """
 
+    ATTRIBUTE = Attribute(
+        id="issue_pr_templates",
+        name="Issue & Pull Request Templates",
+        category="Repository Structure",
+        tier=3,
+        description="Standardized templates for issues and PRs",
+        criteria="PR template and issue templates in .github/",
+        default_weight=0.015,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "issue_pr_templates"
@@ -326,15 +412,7 @@ class IssuePRTemplatesAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="Issue & Pull Request Templates",
-            category="Repository Structure",
-            tier=self.tier,
-            description="Standardized templates for issues and PRs",
-            criteria="PR template and issue templates in .github/",
-            default_weight=0.015,
-        )
+        return self.ATTRIBUTE
 
     def assess(self, repository: Repository) -> Finding:
         """Check for GitHub issue and PR templates.
@@ -346,14 +424,12 @@ class IssuePRTemplatesAssessor(BaseAssessor):
         score = 0
         evidence = []
 
-        # Check for PR template (50%)
-        pr_template_paths = [
-            repository.path / ".github" / "PULL_REQUEST_TEMPLATE.md",
-            repository.path / "PULL_REQUEST_TEMPLATE.md",
-            repository.path / ".github" / "pull_request_template.md",
-        ]
+        github_entries = repository.github_dir_contents
 
-        pr_template_found = any(p.exists() for p in pr_template_paths)
+        # Check for PR template (50%)
+        pr_template_found = "pull_request_template.md" in github_entries or (
+            repository.fs.exists(repository.path / "PULL_REQUEST_TEMPLATE.md")
+        )
 
         if pr_template_found:
             score += 50
@@ -362,16 +438,18 @@ class IssuePRTemplatesAssessor(BaseAssessor):
             evidence.append("No PR template found")
 
         # Check for issue templates (50%)
-        issue_template_dir = repository.path / ".github" / "ISSUE_TEMPLATE"
+        template_count = 0
+        issue_template_entry = github_entries.get("issue_template")
 
-        if issue_template_dir.exists() and issue_template_dir.is_dir():
+        if issue_template_entry is not None and issue_template_entry.is_dir():
             try:
                 # Count .md and .yml files (both formats supported)
-                md_templates = list(issue_template_dir.glob("*.md"))
-                yml_templates = list(issue_template_dir.glob("*.yml")) + list(
-                    issue_template_dir.glob("*.yaml")
-                )
-                template_count = len(md_templates) + len(yml_templates)
+                with os.scandir(issue_template_entry.path) as entries:
+                    template_count = sum(
+                        1
+                        for entry in entries
+                        if entry.name.endswith((".md", ".yml", ".yaml"))
+                    )
 
                 if template_count >= 2:
                     score += 50
@@ -396,7 +474,7 @@ class IssuePRTemplatesAssessor(BaseAssessor):
             attribute=self.attribute,
             status=status,
             score=score,
-            measured_value=f"PR:{pr_template_found}, Issues:{template_count if issue_template_dir.exists() else 0}",
+            measured_value=f"PR:{pr_template_found}, Issues:{template_count}",
             threshold="PR template + ≥2 issue templates",
             evidence=evidence,
             remediation=self._create_remediation() if status == "fail" else None,
@@ -485,6 +563,31 @@ class SeparationOfConcernsAssessor(BaseAssessor):
     maintainability, and reduce cognitive load for AI.
     """
 
+    # Catch-all module names, in reporting order
+    ANTIPATTERN_NAMES = ("utils.py", "helpers.py", "common.py", "misc.py")
+
+    # Layer-based directory anti-patterns, in reporting order
+    LAYER_DIRS = ("models", "views", "controllers", "services")
+
+    # Most files sized for the cohesion check; larger trees are sampled at
+    # an even stride over the sorted paths so the ratio still covers the
+    # whole walk and doesn't depend on directory listing order
+    MAX_COHESION_FILES = 2000
+
+    # Thread pool sizing for the cohesion line counts
+    PARALLEL_MIN_FILES = 64
+    MAX_LINE_COUNT_WORKERS = 32
+
+    ATTRIBUTE = Attribute(
+        id="separation_of_concerns",
+        name="Separation of Concerns",
+        category="Code Organization",
+        tier=2,
+        description="Code organized with single responsibility per module",
+        criteria="Feature-based organization, cohesive modules, low coupling",
+        default_weight=0.03,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "separation_of_concerns"
@@ -495,15 +598,7 @@ class SeparationOfConcernsAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="Separation of Concerns",
-            category="Code Organization",
-            tier=self.tier,
-            description="Code organized with single responsibility per module",
-            criteria="Feature-based organization, cohesive modules, low coupling",
-            default_weight=0.03,
-        )
+        return self.ATTRIBUTE
 
     def assess(self, repository: Repository) -> Finding:
         """Check for separation of concerns anti-patterns.
@@ -516,8 +611,11 @@ class SeparationOfConcernsAssessor(BaseAssessor):
         score = 0
         evidence = []
 
+        # Single pruned walk shared by all three checks
+        py_files, antipattern_files, found_layers = self._scan_repo_once(repository)
+
         # Check 1: Directory organization (40%)
-        org_score = self._check_directory_organization(repository)
+        org_score = self._check_directory_organization(found_layers)
         score += org_score * 0.4
         if org_score >= 80:
             evidence.append("Good directory organization (feature-based or flat)")
@@ -525,14 +623,15 @@ class SeparationOfConcernsAssessor(BaseAssessor):
             evidence.append("Layer-based directories detected (models/, views/, etc.)")
 
         # Check 2: File cohesion via size (30%)
-        cohesion_score, file_stats = self._check_file_cohesion(repository)
+        cohesion_score, file_stats = self._check_file_cohesion(py_files)
         score += cohesion_score * 0.3
-        evidence.append(
-            f"File cohesion: {file_stats['oversized']}/{file_stats['total']} files >500 lines"
-        )
+        cohesion_evidence = f"File cohesion: {file_stats['oversized']}/{file_stats['total']} files >500 lines"
+        if file_stats["sampled_from"] is not None:
+            cohesion_evidence += f" (sampled from {file_stats['sampled_from']})"
+        evidence.append(cohesion_evidence)
 
         # Check 3: Module naming (30%)
-        naming_score, antipatterns = self._check_module_naming(repository)
+        naming_score, antipatterns = self._check_module_naming(antipattern_files)
         score += naming_score * 0.3
         if antipatterns:
             evidence.append(f"Anti-pattern files found: {', '.join(antipatterns[:3])}")
@@ -552,21 +651,8 @@ class SeparationOfConcernsAssessor(BaseAssessor):
             error_message=None,
         )
 
-    def _check_directory_organization(self, repository: Repository) -> float:
+    def _check_directory_organization(self, found_layers: list) -> float:
         """Check for layer-based anti-patterns."""
-        # Layer-based anti-patterns (BAD)
-        layer_dirs = ["models", "views", "controllers", "services"]
-
-        # Check src directory if it exists
-        check_path = repository.path / "src"
-        if not check_path.exists():
-            check_path = repository.path
-
-        found_layers = []
-        for layer in layer_dirs:
-            if (check_path / layer).exists():
-                found_layers.append(layer)
-
         # Score: 100 if no layers, 60 if any layers found
         if not found_layers:
             return 100.0
@@ -574,71 +660,135 @@ class SeparationOfConcernsAssessor(BaseAssessor):
             # Penalty per layer directory
             return max(60.0, 100.0 - (len(found_layers) * 15))
 
-    def _check_file_cohesion(self, repository: Repository) -> tuple:
-        """Check file sizes as cohesion indicator."""
+    def _scan_repo_once(self, repository: Repository) -> tuple:
+        """Gather everything the checks need from the shared repository scans.
+
+        Python files come from ``repository.python_files`` (one pruned walk
+        per Repository, shared with other assessors). Layer directories are
+        matched against the subdirectories of src/ if it exists, else the
+        root.
+
+        Returns:
+            Tuple of (python file DirEntry objects, catch-all module names,
+            layer directory names)
+        """
+        py_files = repository.python_files
+
+        antipattern_names = self.ANTIPATTERN_NAMES
+        antipattern_files = [
+            entry.name for entry in py_files if entry.name in antipattern_names
+        ]
+        antipattern_files.sort(key=antipattern_names.index)
+
+        if "src" in repository.top_level_dirs:
+            src_listing = repository.fs.listdir(repository.path / "src")
+            subdir_names = {
+                name for name, entry in src_listing.items() if entry.is_dir()
+            }
+        else:
+            subdir_names = repository.top_level_dirs
+        layer_names = subdir_names.intersection(self.LAYER_DIRS)
+        found_layers = [layer for layer in self.LAYER_DIRS if layer in layer_names]
+
+        return py_files, antipattern_files, found_layers
+
+    def _check_file_cohesion(
+        self, py_files: Sequence[os.DirEntry]
+    ) -> tuple[float, dict[str, int | None]]:
+        """Check file sizes as cohesion indicator.
+
+        Returns:
+            Tuple of (score, stats); stats has the "total" and "oversized"
+            file counts and "sampled_from", the number of files before
+            sampling (None if every file was checked)
+        """
         threshold = 500  # lines
         total_files = 0
         oversized_files = 0
 
-        # Check Python files
-        try:
-            py_files = list(repository.path.rglob("*.py"))
-            for py_file in py_files:
-                # Skip venv, node_modules, etc.
-                if any(
-                    part in py_file.parts
-                    for part in [".venv", "venv", "node_modules", ".git"]
-                ):
-                    continue
-
-                try:
-                    with open(py_file, "r", encoding="utf-8") as f:
-                        lines = len(f.readlines())
-                    total_files += 1
-                    if lines > threshold:
-                        oversized_files += 1
-                except (OSError, UnicodeDecodeError):
-                    continue
+        sampled_from = None
+        if len(py_files) > self.MAX_COHESION_FILES:
+            sampled_from = len(py_files)
+            stride = -(-sampled_from // self.MAX_COHESION_FILES)
+            py_files = sorted(py_files, key=lambda entry: entry.path)[::stride]
+
+        # Reads are I/O-bound, so threads overlap them despite the GIL; below
+        # PARALLEL_MIN_FILES the pool costs more than it saves
+        if len(py_files) >= self.PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_LINE_COUNT_WORKERS, len(py_files))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda py_file: self._is_oversized(py_file, threshold),
+                        py_files,
+                    )
+                )
+        else:
+            results = [self._is_oversized(py_file, threshold) for py_file in py_files]
 
-        except OSError:
-            pass
+        for oversized in results:
+            if oversized is None:
+                continue
+            total_files += 1
+            if oversized:
+                oversized_files += 1
 
         if total_files == 0:
-            return 100.0, {"total": 0, "oversized": 0}
+            return 100.0, {"total": 0, "oversized": 0, "sampled_from": sampled_from}
 
         # Score: penalize based on percentage of oversized files
         oversized_ratio = oversized_files / total_files
-        cohesion_score = max(0, 100.0 - (oversized_ratio * 100))
+        cohesion_score = max(0.0, 100.0 - (oversized_ratio * 100))
 
-        return cohesion_score, {"total": total_files, "oversized": oversized_files}
+        return cohesion_score, {
+            "total": total_files,
+            "oversized": oversized_files,
+            "sampled_from": sampled_from,
+        }
 
-    def _check_module_naming(self, repository: Repository) -> tuple:
-        """Check for catch-all module anti-patterns."""
-        antipattern_names = ["utils.py", "helpers.py", "common.py", "misc.py"]
+    def _is_oversized(self, py_file: os.DirEntry, threshold: int) -> bool | None:
+        """Check whether a file has more than ``threshold`` lines.
 
-        found = []
+        Returns None if the file can't be read, so it is left out of the totals.
+        """
         try:
-            for pattern in antipattern_names:
-                matches = list(repository.path.rglob(pattern))
-                # Filter out venv/node_modules
-                matches = [
-                    m
-                    for m in matches
-                    if not any(
-                        part in m.parts
-                        for part in [".venv", "venv", "node_modules", ".git"]
-                    )
-                ]
-                if matches:
-                    found.extend([m.name for m in matches])
-
+            # Every line but the last ends in a newline byte, so a file
+            # can't have more lines than bytes; small files are known
+            # to be within the threshold without being opened.
+            return (
+                py_file.stat().st_size > threshold
+                and self._count_lines(py_file.path, threshold) > threshold
+            )
         except OSError:
-            pass
+            return None
+
+    def _count_lines(self, file_path: str, limit: int) -> int:
+        """Count lines by scanning raw bytes for newlines in 64KB chunks.
 
+        Stops as soon as the count exceeds ``limit``, so the result is exact
+        up to ``limit`` and only guaranteed to be greater than it beyond
+        that. A trailing line without a newline still counts as a line.
+        """
+        lines = 0
+        last_chunk = b""
+        with open(file_path, "rb") as f:
+            while chunk := f.read(65536):
+                lines += chunk.count(b"\n")
+                if lines > limit:
+                    return lines
+                last_chunk = chunk
+
+        if last_chunk and not last_chunk.endswith(b"\n"):
+            lines += 1
+        return lines
+
+    def _check_module_naming(self, antipattern_files: list) -> tuple:
+        """Check for catch-all module anti-patterns."""
         # Score: 100 if none found, -20 per antipattern file
-        naming_score = max(0, 100.0 - (len(found) * 20))
+        naming_score = max(0, 100.0 - (len(antipattern_files) * 20))
 
-        return naming_score, found
+        return naming_score, antipattern_files
 
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for separation of concerns."""
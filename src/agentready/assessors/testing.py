@@ -1,13 +1,229 @@
 """Testing assessors for test coverage, naming conventions, and pre-commit hooks."""
 
+import json
+import os
 import re
+import tomllib
 from pathlib import Path
 
 from ..models.attribute import Attribute
 from ..models.finding import Citation, Finding, Remediation
 from ..models.repository import Repository
+from ..utils.manifest_cache import load_package_json, load_pyproject
 from .base import BaseAssessor
 
+# Remediation guidance below is static, so each object is built once at import
+# and shared by every failing finding. Its list fields are tuples, so one
+# finding's remediation can't be changed in place under the others.
+_COVERAGE_REMEDIATION = Remediation(
+    summary="Configure test coverage with ≥80% threshold",
+    steps=(
+        "Install coverage tool (pytest-cov for Python, jest for JavaScript)",
+        "Configure coverage threshold in project config",
+        "Add coverage reporting to CI/CD pipeline",
+        "Run coverage locally before committing",
+    ),
+    tools=("pytest-cov", "jest", "vitest", "coverage"),
+    commands=(
+        "# Python",
+        "pip install pytest-cov",
+        "pytest --cov=src --cov-report=term-missing --cov-fail-under=80",
+        "",
+        "# JavaScript",
+        "npm install --save-dev jest",
+        "npm test -- --coverage --coverageThreshold='{\\'global\\': {\\'lines\\': 80}}'",
+    ),
+    examples=(
+        """# Python - pyproject.toml
+[tool.pytest.ini_options]
+addopts = "--cov=src --cov-report=term-missing"
+
+[tool.coverage.report]
+fail_under = 80
+""",
+        """// JavaScript - package.json
+{
+  "jest": {
+    "coverageThreshold": {
+      "global": {
+        "lines": 80,
+        "statements": 80,
+        "functions": 80,
+        "branches": 80
+      }
+    }
+  }
+}
+""",
+    ),
+    citations=(
+        Citation(
+            source="pytest-cov",
+            title="Coverage Configuration",
+            url="https://pytest-cov.readthedocs.io/",
+            relevance="pytest-cov configuration guide",
+        ),
+    ),
+)
+
+
+_PRECOMMIT_REMEDIATION = Remediation(
+    summary="Configure pre-commit hooks for automated code quality checks",
+    steps=(
+        "Install pre-commit framework",
+        "Create .pre-commit-config.yaml",
+        "Add hooks for linting and formatting",
+        "Install hooks: pre-commit install",
+        "Run on all files: pre-commit run --all-files",
+    ),
+    tools=("pre-commit",),
+    commands=(
+        "pip install pre-commit",
+        "pre-commit install",
+        "pre-commit run --all-files",
+    ),
+    examples=(
+        """# .pre-commit-config.yaml
+repos:
+  - repo: https://github.com/pre-commit/pre-commit-hooks
+    rev: v4.4.0
+    hooks:
+      - id: trailing-whitespace
+      - id: end-of-file-fixer
+      - id: check-yaml
+      - id: check-added-large-files
+
+  - repo: https://github.com/psf/black
+    rev: 23.3.0
+    hooks:
+      - id: black
+
+  - repo: https://github.com/pycqa/isort
+    rev: 5.12.0
+    hooks:
+      - id: isort
+""",
+    ),
+    citations=(
+        Citation(
+            source="pre-commit.com",
+            title="Pre-commit Framework",
+            url="https://pre-commit.com/",
+            relevance="Official pre-commit documentation",
+        ),
+    ),
+)
+
+
+_CICD_REMEDIATION = Remediation(
+    summary="Add or improve CI/CD pipeline configuration",
+    steps=(
+        "Create CI config for your platform (GitHub Actions, GitLab CI, etc.)",
+        "Define jobs: lint, test, build",
+        "Use descriptive job and step names",
+        "Configure dependency caching",
+        "Enable parallel job execution",
+        "Upload artifacts: test results, coverage reports",
+        "Add status badge to README",
+    ),
+    tools=("github-actions", "gitlab-ci", "circleci"),
+    commands=(
+        "# Create GitHub Actions workflow",
+        "mkdir -p .github/workflows",
+        "touch .github/workflows/ci.yml",
+        "",
+        "# Validate workflow",
+        "gh workflow view ci.yml",
+    ),
+    examples=(
+        """# .github/workflows/ci.yml - Good example
+
+name: CI Pipeline
+
+on:
+  push:
+    branches: [main]
+  pull_request:
+    branches: [main]
+
+jobs:
+  lint:
+    name: Lint Code
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+
+      - name: Set up Python
+        uses: actions/setup-python@v5
+        with:
+          python-version: '3.11'
+          cache: 'pip'  # Caching
+
+      - name: Install dependencies
+        run: pip install -r requirements.txt
+
+      - name: Run linters
+        run: |
+          black --check .
+          isort --check .
+          ruff check .
+
+  test:
+    name: Run Tests
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+
+      - name: Set up Python
+        uses: actions/setup-python@v5
+        with:
+          python-version: '3.11'
+          cache: 'pip'
+
+      - name: Install dependencies
+        run: pip install -r requirements.txt
+
+      - name: Run tests with coverage
+        run: pytest --cov --cov-report=xml
+
+      - name: Upload coverage reports
+        uses: codecov/codecov-action@v3
+        with:
+          files: ./coverage.xml
+
+  build:
+    name: Build Package
+    runs-on: ubuntu-latest
+    needs: [lint, test]  # Runs after lint/test pass
+    steps:
+      - uses: actions/checkout@v4
+
+      - name: Build package
+        run: python -m build
+
+      - name: Upload build artifacts
+        uses: actions/upload-artifact@v3
+        with:
+          name: dist
+          path: dist/
+""",
+    ),
+    citations=(
+        Citation(
+            source="GitHub",
+            title="GitHub Actions Documentation",
+            url="https://docs.github.com/en/actions",
+            relevance="Official GitHub Actions guide",
+        ),
+        Citation(
+            source="CircleCI",
+            title="CI/CD Best Practices",
+            url="https://circleci.com/blog/ci-cd-best-practices/",
+            relevance="Industry best practices for CI/CD",
+        ),
+    ),
+)
+
 
 class TestCoverageAssessor(BaseAssessor):
     """Assesses test coverage requirements.
@@ -15,6 +231,28 @@ class TestCoverageAssessor(BaseAssessor):
     Tier 2 Critical (3% weight) - Test coverage is important for AI-assisted refactoring.
     """
 
+    # Root-level directories that hold tests
+    TEST_DIRS = frozenset({"tests", "test", "spec", "__tests__"})
+
+    # Root-level files that can hold Python coverage configuration
+    COVERAGE_CONFIGS = frozenset({".coveragerc", "pyproject.toml", "setup.cfg"})
+
+    # Languages whose coverage is read from package.json
+    JAVASCRIPT_LANGUAGES = frozenset({"JavaScript", "TypeScript"})
+
+    # Distribution name at the start of a PEP 508 requirement string
+    REQUIREMENT_NAME_PATTERN = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+    ATTRIBUTE = Attribute(
+        id="test_coverage",
+        name="Test Coverage Requirements",
+        category="Testing & CI/CD",
+        tier=2,
+        description="Test coverage thresholds configured and enforced",
+        criteria=">80% code coverage",
+        default_weight=0.03,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "test_coverage"
@@ -25,20 +263,11 @@ class TestCoverageAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="Test Coverage Requirements",
-            category="Testing & CI/CD",
-            tier=self.tier,
-            description="Test coverage thresholds configured and enforced",
-            criteria=">80% code coverage",
-            default_weight=0.03,
-        )
+        return self.ATTRIBUTE
 
     def is_applicable(self, repository: Repository) -> bool:
         """Applicable if tests directory exists."""
-        test_dirs = ["tests", "test", "spec", "__tests__"]
-        return any((repository.path / d).exists() for d in test_dirs)
+        return not self.TEST_DIRS.isdisjoint(repository.root_dir_entries)
 
     def assess(self, repository: Repository) -> Finding:
         """Check for test coverage configuration and actual coverage.
@@ -47,36 +276,33 @@ class TestCoverageAssessor(BaseAssessor):
         - Python: pytest.ini, .coveragerc, pyproject.toml with coverage config
         - JavaScript: jest.config.js, package.json with coverage threshold
         """
-        if "Python" in repository.languages:
+        languages = repository.languages
+        if "Python" in languages:
             return self._assess_python_coverage(repository)
-        elif any(lang in repository.languages for lang in ["JavaScript", "TypeScript"]):
+        elif not self.JAVASCRIPT_LANGUAGES.isdisjoint(languages):
             return self._assess_javascript_coverage(repository)
         else:
             return Finding.not_applicable(
                 self.attribute,
-                reason=f"Coverage check not implemented for {list(repository.languages.keys())}",
+                reason=f"Coverage check not implemented for {list(languages.keys())}",
             )
 
     def _assess_python_coverage(self, repository: Repository) -> Finding:
         """Assess Python test coverage configuration."""
-        # Check for coverage configuration files
-        coverage_configs = [
-            repository.path / ".coveragerc",
-            repository.path / "pyproject.toml",
-            repository.path / "setup.cfg",
-        ]
-
-        has_coverage_config = any(f.exists() for f in coverage_configs)
+        # Check for coverage configuration files against the shared root
+        # listing instead of stat-ing each candidate
+        root_entries = repository.root_dir_entries
+        has_coverage_config = not self.COVERAGE_CONFIGS.isdisjoint(root_entries)
 
         # Check for pytest-cov in dependencies
         has_pytest_cov = False
-        pyproject = repository.path / "pyproject.toml"
-        if pyproject.exists():
+        if "pyproject.toml" in root_entries:
             try:
-                with open(pyproject, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    has_pytest_cov = "pytest-cov" in content
-            except OSError:
+                pyproject = load_pyproject(
+                    os.path.join(repository.path_str, "pyproject.toml")
+                )
+                has_pytest_cov = self._declares_dependency(pyproject, "pytest-cov")
+            except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
                 pass
 
         # Score based on configuration presence
@@ -110,11 +336,63 @@ class TestCoverageAssessor(BaseAssessor):
             error_message=None,
         )
 
+    def _declares_dependency(self, pyproject: dict, package: str) -> bool:
+        """Check the dependency tables of a parsed pyproject.toml for a package.
+
+        Covers PEP 621 dependencies and extras, PEP 735 dependency groups,
+        Hatch environment dependencies, and Poetry, PDM and uv dev
+        dependencies. Comments and unrelated tables never match.
+        """
+        # Values of the wrong type (e.g. `poetry = "x"`) are treated as empty
+        # rather than raising, so a malformed pyproject.toml is still scored
+        table, entries = self._toml_table, self._toml_entries
+        requirements = []
+
+        project = table(pyproject.get("project"))
+        requirements.extend(entries(project.get("dependencies")))
+        for extra in table(project.get("optional-dependencies")).values():
+            requirements.extend(entries(extra))
+        for group in table(pyproject.get("dependency-groups")).values():
+            requirements.extend(entries(group))
+
+        tool = table(pyproject.get("tool"))
+        poetry = table(tool.get("poetry"))
+        requirements.extend(entries(poetry.get("dependencies")))
+        requirements.extend(entries(poetry.get("dev-dependencies")))
+        for group in table(poetry.get("group")).values():
+            requirements.extend(entries(table(group).get("dependencies")))
+        pdm = table(tool.get("pdm"))
+        for group in table(pdm.get("dev-dependencies")).values():
+            requirements.extend(entries(group))
+        requirements.extend(entries(table(tool.get("uv")).get("dev-dependencies")))
+        hatch = table(tool.get("hatch"))
+        for env in table(hatch.get("envs")).values():
+            requirements.extend(entries(table(env).get("dependencies")))
+            requirements.extend(entries(table(env).get("extra-dependencies")))
+
+        for requirement in requirements:
+            # Skip non-string entries such as {include-group = "..."}
+            if not isinstance(requirement, str):
+                continue
+            match = self.REQUIREMENT_NAME_PATTERN.match(requirement)
+            if match and re.sub(r"[-_.]+", "-", match.group(1)).lower() == package:
+                return True
+
+        return False
+
+    @staticmethod
+    def _toml_table(value) -> dict:
+        """Return value if it is a TOML table, else an empty dict."""
+        return value if isinstance(value, dict) else {}
+
+    @staticmethod
+    def _toml_entries(value) -> list:
+        """Return the items of a TOML array or the keys of a table."""
+        return list(value) if isinstance(value, (list, dict)) else []
+
     def _assess_javascript_coverage(self, repository: Repository) -> Finding:
         """Assess JavaScript/TypeScript test coverage configuration."""
-        package_json = repository.path / "package.json"
-
-        if not package_json.exists():
+        if "package.json" not in repository.root_dir_entries:
             return Finding(
                 attribute=self.attribute,
                 status="fail",
@@ -127,10 +405,7 @@ class TestCoverageAssessor(BaseAssessor):
             )
 
         try:
-            import json
-
-            with open(package_json, "r") as f:
-                pkg = json.load(f)
+            pkg = load_package_json(os.path.join(repository.path_str, "package.json"))
 
             # Check for jest or vitest with coverage
             has_jest = "jest" in pkg.get("devDependencies", {})
@@ -167,61 +442,22 @@ class TestCoverageAssessor(BaseAssessor):
 
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for test coverage."""
-        return Remediation(
-            summary="Configure test coverage with ≥80% threshold",
-            steps=[
-                "Install coverage tool (pytest-cov for Python, jest for JavaScript)",
-                "Configure coverage threshold in project config",
-                "Add coverage reporting to CI/CD pipeline",
-                "Run coverage locally before committing",
-            ],
-            tools=["pytest-cov", "jest", "vitest", "coverage"],
-            commands=[
-                "# Python",
-                "pip install pytest-cov",
-                "pytest --cov=src --cov-report=term-missing --cov-fail-under=80",
-                "",
-                "# JavaScript",
-                "npm install --save-dev jest",
-                "npm test -- --coverage --coverageThreshold='{\\'global\\': {\\'lines\\': 80}}'",
-            ],
-            examples=[
-                """# Python - pyproject.toml
-[tool.pytest.ini_options]
-addopts = "--cov=src --cov-report=term-missing"
-
-[tool.coverage.report]
-fail_under = 80
-""",
-                """// JavaScript - package.json
-{
-  "jest": {
-    "coverageThreshold": {
-      "global": {
-        "lines": 80,
-        "statements": 80,
-        "functions": 80,
-        "branches": 80
-      }
-    }
-  }
-}
-""",
-            ],
-            citations=[
-                Citation(
-                    source="pytest-cov",
-                    title="Coverage Configuration",
-                    url="https://pytest-cov.readthedocs.io/",
-                    relevance="pytest-cov configuration guide",
-                )
-            ],
-        )
+        return _COVERAGE_REMEDIATION
 
 
 class PreCommitHooksAssessor(BaseAssessor):
     """Assesses pre-commit hooks configuration."""
 
+    ATTRIBUTE = Attribute(
+        id="precommit_hooks",
+        name="Pre-commit Hooks & CI/CD Linting",
+        category="Testing & CI/CD",
+        tier=2,
+        description="Pre-commit hooks configured for linting and formatting",
+        criteria=".pre-commit-config.yaml exists",
+        default_weight=0.03,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "precommit_hooks"
@@ -232,21 +468,11 @@ class PreCommitHooksAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="Pre-commit Hooks & CI/CD Linting",
-            category="Testing & CI/CD",
-            tier=self.tier,
-            description="Pre-commit hooks configured for linting and formatting",
-            criteria=".pre-commit-config.yaml exists",
-            default_weight=0.03,
-        )
+        return self.ATTRIBUTE
 
     def assess(self, repository: Repository) -> Finding:
         """Check for pre-commit configuration."""
-        precommit_config = repository.path / ".pre-commit-config.yaml"
-
-        if precommit_config.exists():
+        if ".pre-commit-config.yaml" in repository.root_dir_entries:
             return Finding(
                 attribute=self.attribute,
                 status="pass",
@@ -271,50 +497,7 @@ class PreCommitHooksAssessor(BaseAssessor):
 
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for pre-commit hooks."""
-        return Remediation(
-            summary="Configure pre-commit hooks for automated code quality checks",
-            steps=[
-                "Install pre-commit framework",
-                "Create .pre-commit-config.yaml",
-                "Add hooks for linting and formatting",
-                "Install hooks: pre-commit install",
-                "Run on all files: pre-commit run --all-files",
-            ],
-            tools=["pre-commit"],
-            commands=[
-                "pip install pre-commit",
-                "pre-commit install",
-                "pre-commit run --all-files",
-            ],
-            examples=["""# .pre-commit-config.yaml
-repos:
-  - repo: https://github.com/pre-commit/pre-commit-hooks
-    rev: v4.4.0
-    hooks:
-      - id: trailing-whitespace
-      - id: end-of-file-fixer
-      - id: check-yaml
-      - id: check-added-large-files
-
-  - repo: https://github.com/psf/black
-    rev: 23.3.0
-    hooks:
-      - id: black
-
-  - repo: https://github.com/pycqa/isort
-    rev: 5.12.0
-    hooks:
-      - id: isort
-"""],
-            citations=[
-                Citation(
-                    source="pre-commit.com",
-                    title="Pre-commit Framework",
-                    url="https://pre-commit.com/",
-                    relevance="Official pre-commit documentation",
-                )
-            ],
-        )
+        return _PRECOMMIT_REMEDIATION
 
 
 class CICDPipelineVisibilityAssessor(BaseAssessor):
@@ -324,6 +507,16 @@ class CICDPipelineVisibilityAssessor(BaseAssessor):
     build/test/deploy processes and suggest improvements.
     """
 
+    ATTRIBUTE = Attribute(
+        id="cicd_pipeline_visibility",
+        name="CI/CD Pipeline Visibility",
+        category="Testing & CI/CD",
+        tier=3,
+        description="Clear, well-documented CI/CD configuration files",
+        criteria="CI config with descriptive names, caching, parallelization",
+        default_weight=0.015,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "cicd_pipeline_visibility"
@@ -334,15 +527,7 @@ class CICDPipelineVisibilityAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="CI/CD Pipeline Visibility",
-            category="Testing & CI/CD",
-            tier=self.tier,
-            description="Clear, well-documented CI/CD configuration files",
-            criteria="CI config with descriptive names, caching, parallelization",
-            default_weight=0.015,
-        )
+        return self.ATTRIBUTE
 
     def assess(self, repository: Repository) -> Finding:
         """Check for CI/CD configuration and assess quality.
@@ -532,114 +717,7 @@ class CICDPipelineVisibilityAssessor(BaseAssessor):
 
     def _create_remediation(self) -> Remediation:
         """Create remediation guidance for CI/CD visibility."""
-        return Remediation(
-            summary="Add or improve CI/CD pipeline configuration",
-            steps=[
-                "Create CI config for your platform (GitHub Actions, GitLab CI, etc.)",
-                "Define jobs: lint, test, build",
-                "Use descriptive job and step names",
-                "Configure dependency caching",
-                "Enable parallel job execution",
-                "Upload artifacts: test results, coverage reports",
-                "Add status badge to README",
-            ],
-            tools=["github-actions", "gitlab-ci", "circleci"],
-            commands=[
-                "# Create GitHub Actions workflow",
-                "mkdir -p .github/workflows",
-                "touch .github/workflows/ci.yml",
-                "",
-                "# Validate workflow",
-                "gh workflow view ci.yml",
-            ],
-            examples=[
-                """# .github/workflows/ci.yml - Good example
-
-name: CI Pipeline
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-
-jobs:
-  lint:
-    name: Lint Code
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Set up Python
-        uses: actions/setup-python@v5
-        with:
-          python-version: '3.11'
-          cache: 'pip'  # Caching
-
-      - name: Install dependencies
-        run: pip install -r requirements.txt
-
-      - name: Run linters
-        run: |
-          black --check .
-          isort --check .
-          ruff check .
-
-  test:
-    name: Run Tests
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Set up Python
-        uses: actions/setup-python@v5
-        with:
-          python-version: '3.11'
-          cache: 'pip'
-
-      - name: Install dependencies
-        run: pip install -r requirements.txt
-
-      - name: Run tests with coverage
-        run: pytest --cov --cov-report=xml
-
-      - name: Upload coverage reports
-        uses: codecov/codecov-action@v3
-        with:
-          files: ./coverage.xml
-
-  build:
-    name: Build Package
-    runs-on: ubuntu-latest
-    needs: [lint, test]  # Runs after lint/test pass
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Build package
-        run: python -m build
-
-      - name: Upload build artifacts
-        uses: actions/upload-artifact@v3
-        with:
-          name: dist
-          path: dist/
-""",
-            ],
-            citations=[
-                Citation(
-                    source="GitHub",
-                    title="GitHub Actions Documentation",
-                    url="https://docs.github.com/en/actions",
-                    relevance="Official GitHub Actions guide",
-                ),
-                Citation(
-                    source="CircleCI",
-                    title="CI/CD Best Practices",
-                    url="https://circleci.com/blog/ci-cd-best-practices/",
-                    relevance="Industry best practices for CI/CD",
-                ),
-            ],
-        )
+        return _CICD_REMEDIATION
 
 
 class BranchProtectionAssessor(BaseAssessor):
@@ -650,6 +728,16 @@ class BranchProtectionAssessor(BaseAssessor):
     return not_applicable until GitHub API integration is implemented.
     """
 
+    ATTRIBUTE = Attribute(
+        id="branch_protection",
+        name="Branch Protection Rules",
+        category="Git & Version Control",
+        tier=4,
+        description="Required status checks and review approvals before merging",
+        criteria="Branch protection enabled with status checks and required reviews",
+        default_weight=0.005,
+    )
+
     @property
     def attribute_id(self) -> str:
         return "branch_protection"
@@ -660,15 +748,7 @@ class BranchProtectionAssessor(BaseAssessor):
 
     @property
     def attribute(self) -> Attribute:
-        return Attribute(
-            id=self.attribute_id,
-            name="Branch Protection Rules",
-            category="Git & Version Control",
-            tier=self.tier,
-            description="Required status checks and review approvals before merging",
-            criteria="Branch protection enabled with status checks and required reviews",
-            default_weight=0.005,
-        )
+        return self.ATTRIBUTE
 
     def assess(self, repository: Repository) -> Finding:
         """Stub implementation - requires GitHub API integration."""
@@ -2,10 +2,14 @@
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.metadata import version as get_version
 from pathlib import Path
 from typing import Optional
 
 import click
+import yaml
 from pydantic import ValidationError
 
 from ..assessors import create_all_assessors
@@ -14,14 +18,17 @@ from ..reporters.html import HTMLReporter
 from ..reporters.markdown import MarkdownReporter
 from ..services.batch_scanner import BatchScanner
 
+try:
+    from yaml import CSafeLoader as _YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLSafeLoader
+
+# Threads used to write batch report files concurrently
+REPORT_WRITER_WORKERS = 4
+
 
 def _get_agentready_version() -> str:
     """Get AgentReady version from package metadata."""
-    try:
-        from importlib.metadata import version as get_version
-    except ImportError:
-        from importlib_metadata import version as get_version
-
     try:
         return get_version("agentready")
     except Exception:
@@ -45,13 +52,10 @@ def _load_config(config_path: Path) -> Config:
         FileNotFoundError: If config file doesn't exist
         yaml.YAMLError: If YAML parsing fails
     """
-    import sys
-
-    import yaml
-
     try:
+        # CSafeLoader (libyaml) when available; same safe subset as SafeLoader
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAMLSafeLoader)
 
         # Pydantic handles all validation automatically
         return Config.from_yaml_dict(data)
@@ -98,8 +102,14 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
     if verbose:
         click.echo(f"\nGenerating reports in {reports_dir}/")
 
+    # Each report writes its own file, so they are generated concurrently
+    # (serialization of one overlaps disk writes of another). Results are
+    # reported in submission order so the output reads the same as a
+    # serial run. Each task is (written files, failure message, callable).
+    tasks = []
+
     # 1. CSV/TSV summary
-    try:
+    def write_csv():
         csv_reporter = CSVReporter()
         csv_reporter.generate(
             batch_assessment, reports_dir / "summary.csv", delimiter=","
@@ -107,61 +117,65 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
         csv_reporter.generate(
             batch_assessment, reports_dir / "summary.tsv", delimiter="\t"
         )
-        if verbose:
-            click.echo("  ✓ summary.csv")
-            click.echo("  ✓ summary.tsv")
-    except Exception as e:
-        click.echo(f"  ✗ CSV generation failed: {e}", err=True)
+
+    tasks.append((["summary.csv", "summary.tsv"], "CSV generation failed", write_csv))
 
     # 2. Aggregated JSON
-    try:
-        json_reporter = AggregatedJSONReporter()
-        json_reporter.generate(batch_assessment, reports_dir / "all-assessments.json")
-        if verbose:
-            click.echo("  ✓ all-assessments.json")
-    except Exception as e:
-        click.echo(f"  ✗ Aggregated JSON generation failed: {e}", err=True)
+    def write_aggregated_json():
+        AggregatedJSONReporter().generate(
+            batch_assessment, reports_dir / "all-assessments.json"
+        )
+
+    tasks.append(
+        (
+            ["all-assessments.json"],
+            "Aggregated JSON generation failed",
+            write_aggregated_json,
+        )
+    )
 
     # 3. Individual reports for each successful assessment
     individual_json = JSONReporter()
-    for result in batch_assessment.results:
-        if result.is_success():
-            assessment = result.assessment
-            base_name = f"{assessment.repository.name}-{assessment.timestamp.strftime('%Y%m%d-%H%M%S')}"
 
-            try:
-                # HTML report
-                html_reporter = HTMLReporter()
-                html_reporter.generate(assessment, reports_dir / f"{base_name}.html")
+    def write_individual_reports(assessment, base_name: str):
+        # HTML report
+        html_reporter = HTMLReporter()
+        html_reporter.generate(assessment, reports_dir / f"{base_name}.html")
 
-                # JSON report
-                individual_json.generate(assessment, reports_dir / f"{base_name}.json")
+        # JSON report
+        individual_json.generate(assessment, reports_dir / f"{base_name}.json")
 
-                # Markdown report
-                markdown_reporter = MarkdownReporter()
-                markdown_reporter.generate(assessment, reports_dir / f"{base_name}.md")
+        # Markdown report
+        markdown_reporter = MarkdownReporter()
+        markdown_reporter.generate(assessment, reports_dir / f"{base_name}.md")
 
-                if verbose:
-                    click.echo(f"  ✓ {base_name}.{{html,json,md}}")
-            except Exception as e:
-                click.echo(
-                    f"  ✗ Individual reports failed for {base_name}: {e}", err=True
+    for result in batch_assessment.results:
+        if result.is_success():
+            assessment = result.assessment
+            base_name = f"{assessment.repository.name}-{assessment.timestamp.strftime('%Y%m%d-%H%M%S')}"
+            tasks.append(
+                (
+                    [f"{base_name}.{{html,json,md}}"],
+                    f"Individual reports failed for {base_name}",
+                    partial(write_individual_reports, assessment, base_name),
                 )
+            )
 
     # 4. Multi-repo summary HTML (index)
-    try:
+    def write_index_html():
         template_dir = Path(__file__).parent.parent / "templates"
         multi_html = MultiRepoHTMLReporter(template_dir)
         multi_html.generate(batch_assessment, reports_dir / "index.html")
-        if verbose:
-            click.echo("  ✓ index.html")
-    except Exception as e:
-        click.echo(f"  ✗ Multi-repo HTML generation failed: {e}", err=True)
+
+    tasks.append(
+        (["index.html"], "Multi-repo HTML generation failed", write_index_html)
+    )
 
     # 5. Failures JSON
     failed_results = [r for r in batch_assessment.results if not r.is_success()]
     if failed_results:
-        try:
+
+        def write_failures_json():
             failures_data = [
                 {
                     "repo_url": r.repository_url,
@@ -173,10 +187,24 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
             ]
             with open(reports_dir / "failures.json", "w", encoding="utf-8") as f:
                 json.dump(failures_data, f, indent=2)
-            if verbose:
-                click.echo("  ✓ failures.json")
-        except Exception as e:
-            click.echo(f"  ✗ Failures JSON generation failed: {e}", err=True)
+
+        tasks.append(
+            (
+                ["failures.json"],
+                "Failures JSON generation failed",
+                write_failures_json,
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=REPORT_WRITER_WORKERS) as executor:
+        futures = [executor.submit(write) for _, _, write in tasks]
+        for (written, failure_message, _), future in zip(tasks, futures):
+            error = future.exception()
+            if error is not None:
+                click.echo(f"  ✗ {failure_message}: {error}", err=True)
+            elif verbose:
+                for name in written:
+                    click.echo(f"  ✓ {name}")
 
     # Print final summary
     click.echo(f"\n✓ Reports generated: {reports_dir}/")
@@ -249,6 +277,14 @@ def _generate_multi_reports(batch_assessment, output_path: Path, verbose: bool)
     default=None,
     help="Custom cache directory (default: .agentready/cache/)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Repositories to assess in parallel (1 runs them in order in-process)",
+)
 @click.option(
     "--generate-heatmap",
     is_flag=True,
@@ -272,6 +308,7 @@ def assess_batch(
     config: Optional[str],
     use_cache: bool,
     cache_dir: Optional[str],
+    jobs: int,
     generate_heatmap: bool,
     heatmap_output: Optional[str],
 ):
@@ -405,7 +442,11 @@ def assess_batch(
 
     # Progress callback
     def show_progress(current: int, total: int):
-        click.echo(f"Assessing repository {current + 1}/{total}...")
+        # The process pool reports completions (from 1), not the next index
+        if jobs > 1 and total > 1:
+            click.echo(f"Completed repository {current}/{total}")
+        else:
+            click.echo(f"Assessing repository {current + 1}/{total}...")
 
     # Run batch assessment
     try:
@@ -416,6 +457,7 @@ def assess_batch(
             use_cache=use_cache,
             verbose=verbose,
             progress_callback=show_progress if verbose else None,
+            jobs=jobs,
         )
     except Exception as e:
         click.echo(f"Error during batch assessment: {e}", err=True)
@@ -526,22 +568,25 @@ def _generate_batch_markdown_report(batch_assessment, output_file: Path) -> None
             )
         lines.append("\n")
 
-    # Results detail
+    # Results detail, one string per result
     lines.append("## Individual Results\n")
     for result in batch_assessment.results:
-        lines.append(f"\n### {result.repository_url}\n")
         if result.is_success():
-            lines.append(f"- **Score**: {result.assessment.overall_score}/100\n")
             lines.append(
+                f"\n### {result.repository_url}\n"
+                f"- **Score**: {result.assessment.overall_score}/100\n"
                 f"- **Certification**: {result.assessment.certification_level}\n"
+                f"- **Duration**: {result.duration_seconds:.1f}s\n"
+                f"- **Cached**: {result.cached}\n"
             )
-            lines.append(f"- **Duration**: {result.duration_seconds:.1f}s\n")
-            lines.append(f"- **Cached**: {result.cached}\n")
         else:
-            lines.append(f"- **Error**: {result.error_type}\n")
-            lines.append(f"- **Details**: {result.error}\n")
-            lines.append(f"- **Duration**: {result.duration_seconds:.1f}s\n")
+            lines.append(
+                f"\n### {result.repository_url}\n"
+                f"- **Error**: {result.error_type}\n"
+                f"- **Details**: {result.error}\n"
+                f"- **Duration**: {result.duration_seconds:.1f}s\n"
+            )
 
-    # Write to file
+    # Write to file in a single call
     with open(output_file, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+        f.write("".join(lines))
@@ -2,6 +2,7 @@
 
 import json
 import os
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -135,6 +136,21 @@ def _run_tbench(
         click.echo(f"Subset: {subset} ({'1-2 tasks' if smoketest else '89 tasks'})")
         click.echo(f"Timeout: {timeout}s\n")
 
+    # Validate API key before preflight, which may offer to install Harbor
+    if agent == "claude-code":
+        api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    elif agent == "cursor-cli":
+        api_key = os.environ.get("CURSOR_API_KEY", "")
+
+    if not api_key:
+        key_name = "ANTHROPIC_API_KEY" if agent == "claude-code" else "CURSOR_API_KEY"
+        click.echo(
+            f"Error: {key_name} environment variable not set.\n"
+            f"Set it with: export {key_name}=your-key-here",
+            err=True,
+        )
+        raise click.Abort()
+
     # Preflight: Check Harbor CLI availability and dataset
     task_path = None
     if not skip_preflight:
@@ -158,26 +174,12 @@ def _run_tbench(
             click.echo(f"\nPreflight check failed:\n{e}\n", err=True)
             raise click.Abort()
 
-    # Validate API key BEFORE creating HarborConfig
-    if agent == "claude-code":
-        api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    elif agent == "cursor-cli":
-        api_key = os.environ.get("CURSOR_API_KEY", "")
-
-    if not api_key:
-        key_name = "ANTHROPIC_API_KEY" if agent == "claude-code" else "CURSOR_API_KEY"
-        click.echo(
-            f"Error: {key_name} environment variable not set.\n"
-            f"Set it with: export {key_name}=your-key-here",
-            err=True,
-        )
-        raise click.Abort()
-
     # Create HarborConfig (will not raise ValueError now)
+    jobs_dir = Path(tempfile.mkdtemp())
     harbor_config = HarborConfig(
         model=model,
         agent=agent,
-        jobs_dir=Path(tempfile.mkdtemp()),
+        jobs_dir=jobs_dir,
         api_key=api_key,
         timeout=timeout,
         n_concurrent=1,
@@ -218,9 +220,16 @@ def _run_tbench(
             import traceback
 
             traceback.print_exc()
+        # Successful runs keep jobs_dir since the trajectory path points
+        # into it; failed runs would only leave an orphaned temp dir
+        shutil.rmtree(jobs_dir, ignore_errors=True)
         raise click.Abort()
 
 
+# Trials are bound by model API latency, so tasks run concurrently by default;
+# capped to stay under provider rate limits
+DEFAULT_MAX_CONCURRENT = 8
+
 # Default Phase 1 task subset (8 diverse tasks, ~2-3 hours per assessor)
 DEFAULT_PHASE1_TASKS = [
     "adaptive-rejection-sampler",  # Math/algorithms
@@ -277,9 +286,12 @@ DEFAULT_PHASE1_TASKS = [
 @click.option(
     "--concurrent",
     "-c",
-    type=int,
-    default=1,
-    help="Number of concurrent tasks to run in parallel (default: 1, recommended: 3-5)",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Number of concurrent tasks to run in parallel "
+        f"(default: number of tasks, at most {DEFAULT_MAX_CONCURRENT})"
+    ),
 )
 @click.option(
     "--smoketest",
@@ -330,11 +342,10 @@ def validate_assessor(
     """
     repo_root = Path.cwd()
 
+    supported = AssessorStateToggler(repo_root=repo_root).list_supported_assessors()
+
     # Handle --list-assessors
     if list_assessors:
-        toggler = AssessorStateToggler(repo_root=repo_root)
-        supported = toggler.list_supported_assessors()
-
         click.echo("Supported Assessors for Validation:")
         click.echo(f"{'=' * 60}")
         for assessor_id in supported:
@@ -352,6 +363,15 @@ def validate_assessor(
         )
         raise click.Abort()
 
+    # Reject unknown assessors before checking Harbor or running anything
+    if assessor not in supported:
+        click.echo(
+            f"Error: Unknown assessor '{assessor}'.\n"
+            f"Supported: {', '.join(supported)}",
+            err=True,
+        )
+        raise click.Abort()
+
     # Validate ANTHROPIC_API_KEY
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not api_key:
@@ -374,6 +394,9 @@ def validate_assessor(
             if verbose:
                 click.echo(f"Using default Phase 1 task subset ({len(tasks)} tasks)\n")
 
+    if concurrent is None:
+        concurrent = min(DEFAULT_MAX_CONCURRENT, len(tasks))
+
     # Convert model name to full identifier
     model_id = f"anthropic/{model}"
 
@@ -398,8 +421,8 @@ def validate_assessor(
 
         # Save JSON results
         json_file = output_path / f"{assessor}.json"
-        with open(json_file, "w") as f:
-            json.dump(
+        json_file.write_text(
+            json.dumps(
                 {
                     "assessor_id": assessor,
                     "tasks": list(tasks),
@@ -409,52 +432,48 @@ def validate_assessor(
                     "deltas": comparison.deltas,
                     "statistical_significance": comparison.statistical_significance,
                 },
-                f,
                 indent=2,
             )
+        )
 
         # Generate Markdown report
         md_file = output_path / f"{assessor}.md"
-        with open(md_file, "w") as f:
-            f.write(f"# Assessor Impact Validation: {assessor}\n\n")
-            f.write(f"**Date**: {comparison.created_at}\n")
-            f.write(f"**Tasks**: {len(tasks)}\n")
-            f.write(f"**Runs per Task**: {runs}\n\n")
-
-            f.write("## Results Summary\n\n")
-            f.write(
-                "| Metric | Baseline (Assessor Fails) | Treatment (Assessor Passes) | Delta |\n"
-            )
-            f.write(
-                "|--------|---------------------------|----------------------------|-------|\n"
-            )
-
-            delta = comparison.deltas["success_rate_delta"]
-            sign = "+" if delta >= 0 else ""
-            f.write(
+        delta = comparison.deltas["success_rate_delta"]
+        success_sign = "+" if delta >= 0 else ""
+        duration_delta = comparison.deltas.get("avg_duration_delta_sec", 0)
+        duration_sign = "+" if duration_delta >= 0 else ""
+        is_sig = comparison.statistical_significance.get(
+            "success_rate_significant", False
+        )
+        p_val = comparison.statistical_significance.get("success_rate_p_value")
+
+        lines = [
+            f"# Assessor Impact Validation: {assessor}\n\n",
+            f"**Date**: {comparison.created_at}\n",
+            f"**Tasks**: {len(tasks)}\n",
+            f"**Runs per Task**: {runs}\n\n",
+            "## Results Summary\n\n",
+            "| Metric | Baseline (Assessor Fails) | Treatment (Assessor Passes) | Delta |\n",
+            "|--------|---------------------------|----------------------------|-------|\n",
+            (
                 f"| Success Rate | {comparison.without_agent.success_rate:.1f}% | "
-                f"{comparison.with_agent.success_rate:.1f}% | **{sign}{delta:.1f} pp** |\n"
-            )
-
-            duration_delta = comparison.deltas.get("avg_duration_delta_sec", 0)
-            sign = "+" if duration_delta >= 0 else ""
-            f.write(
+                f"{comparison.with_agent.success_rate:.1f}% | **{success_sign}{delta:.1f} pp** |\n"
+            ),
+            (
                 f"| Avg Duration | {comparison.without_agent.avg_duration_sec:.1f}s | "
-                f"{comparison.with_agent.avg_duration_sec:.1f}s | {sign}{duration_delta:.1f}s |\n"
-            )
-
-            f.write("\n## Statistical Significance\n\n")
-            is_sig = comparison.statistical_significance.get(
-                "success_rate_significant", False
-            )
-            p_val = comparison.statistical_significance.get("success_rate_p_value")
-            f.write(f"- **Significant**: {'YES ✓' if is_sig else 'NO'}\n")
-            if p_val is not None:
-                f.write(f"- **P-value**: {p_val:.4f}\n")
-
-            f.write("\n## Files\n\n")
-            f.write(f"- JSON: `{json_file}`\n")
-            f.write(f"- Markdown: `{md_file}`\n")
+                f"{comparison.with_agent.avg_duration_sec:.1f}s | {duration_sign}{duration_delta:.1f}s |\n"
+            ),
+            "\n## Statistical Significance\n\n",
+            f"- **Significant**: {'YES ✓' if is_sig else 'NO'}\n",
+        ]
+        if p_val is not None:
+            lines.append(f"- **P-value**: {p_val:.4f}\n")
+        lines.append("\n## Files\n\n")
+        lines.append(f"- JSON: `{json_file}`\n")
+        lines.append(f"- Markdown: `{md_file}`\n")
+
+        # Write to file in a single call
+        md_file.write_text("".join(lines))
 
         click.echo("\nResults saved:")
         click.echo(f"  - JSON: {json_file}")
@@ -0,0 +1,23 @@
+"""Console-script entry point for agentready.
+
+A bare ``agentready --version`` is answered here, before the Click group and
+its command modules are imported; importing those takes most of the runtime
+of a version check. Everything else is handed to the Click CLI unchanged.
+"""
+
+import sys
+
+
+def main():
+    """Run the agentready CLI."""
+    if sys.argv[1:] == ["--version"]:
+        import click
+
+        from .version import version_text
+
+        click.echo(version_text())
+        return
+
+    from .main import cli
+
+    cli()
@@ -1,6 +1,7 @@
 """Harbor benchmark comparison CLI commands."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +17,11 @@ from agentready.services.harbor.dashboard_generator import (
 )
 from agentready.services.harbor.result_parser import parse_harbor_results
 from agentready.services.harbor.runner import HarborNotInstalledError, HarborRunner
+from agentready.utils import fast_json
+
+# Append-only summary of every comparison written under an output directory,
+# so `harbor list` doesn't have to parse each comparison file
+COMPARISON_INDEX = "index.jsonl"
 
 
 def _run_benchmark_phase(
@@ -66,6 +72,20 @@ def _run_benchmark_phase(
     return output_dir
 
 
+def _parse_phase_results(results_dir: Path) -> list:
+    """Parse a phase's Harbor results, aborting on failure."""
+    try:
+        return parse_harbor_results(results_dir)
+    except Exception as e:
+        click.echo(f"❌ Failed to parse results: {e}", err=True)
+        raise click.Abort()
+
+
+def _write_json(comparison: HarborComparison, path: Path) -> None:
+    """Write the comparison as indented JSON."""
+    path.write_bytes(fast_json.dumps_indented(comparison.to_dict()))
+
+
 def _generate_reports(
     comparison: HarborComparison,
     run_dir: Path,
@@ -78,30 +98,75 @@ def _generate_reports(
         Dictionary of report paths
     """
     comparison_base = run_dir / f"comparison_{timestamp}"
-    paths = {}
+    paths = {
+        "json": comparison_base.with_suffix(".json"),
+        "markdown": comparison_base.with_suffix(".md"),
+        "html": comparison_base.with_suffix(".html"),
+    }
+
+    # Each format renders to its own file, so render them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(_write_json, comparison, paths["json"]),
+            executor.submit(generate_markdown_report, comparison, paths["markdown"]),
+            executor.submit(generate_dashboard, comparison, paths["html"]),
+        ]
+    # Re-raise the first failure, as the sequential version did
+    for future in futures:
+        future.result()
 
-    # Generate JSON report
-    paths["json"] = comparison_base.with_suffix(".json")
-    with open(paths["json"], "w") as f:
-        json.dump(comparison.to_dict(), f, indent=2)
     click.echo(f"  ✓ JSON:     {paths['json']}")
-
-    # Generate Markdown report
-    paths["markdown"] = comparison_base.with_suffix(".md")
-    generate_markdown_report(comparison, paths["markdown"])
     click.echo(f"  ✓ Markdown: {paths['markdown']}")
-
-    # Generate HTML dashboard
-    paths["html"] = comparison_base.with_suffix(".html")
-    generate_dashboard(comparison, paths["html"])
     click.echo(f"  ✓ HTML:     {paths['html']}")
 
+    _append_comparison_index(comparison, paths["json"], output_dir)
+
     # Create 'latest' symlinks for easy access
     _create_latest_symlinks(paths, output_dir)
 
     return paths
 
 
+def _append_comparison_index(
+    comparison: HarborComparison, json_path: Path, output_dir: Path
+) -> None:
+    """Record a comparison's summary fields in the output directory index."""
+    try:
+        entry = {
+            "file": json_path.relative_to(output_dir).as_posix(),
+            "created_at": comparison.created_at,
+            "success_rate_delta": comparison.deltas["success_rate_delta"],
+            "avg_duration_delta_pct": comparison.deltas["avg_duration_delta_pct"],
+        }
+        with open(output_dir / COMPARISON_INDEX, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except (ValueError, KeyError, OSError):
+        # The index is only a shortcut; listing falls back to the files
+        pass
+
+
+def _read_comparison_index(output_dir: Path) -> dict:
+    """Read the comparison index, keyed by path relative to output_dir.
+
+    Returns:
+        Mapping of relative comparison file path to its summary entry
+        (empty if there is no index)
+    """
+    entries = {}
+    try:
+        with open(output_dir / COMPARISON_INDEX, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    entries[entry["file"]] = entry
+                except (ValueError, KeyError, TypeError):
+                    # Skip partially written or malformed lines
+                    continue
+    except OSError:
+        pass
+    return entries
+
+
 def _create_latest_symlinks(paths: dict, output_dir: Path) -> None:
     """Create 'latest' symlinks to most recent comparison files."""
     try:
@@ -253,12 +318,11 @@ def compare(
         disable_agent=False,
     )
 
-    # Parse results
     click.echo("Parsing results...")
-    try:
-        without_tasks = parse_harbor_results(without_results_dir)
-        with_tasks = parse_harbor_results(with_results_dir)
+    without_tasks = _parse_phase_results(without_results_dir)
+    with_tasks = _parse_phase_results(with_results_dir)
 
+    try:
         without_metrics = HarborRunMetrics.from_task_results(
             run_id=f"without_{timestamp}",
             agent_file_enabled=False,
@@ -319,21 +383,32 @@ def list_comparisons(output_dir: Path):
         click.echo("  No comparisons found.")
         return
 
+    index = _read_comparison_index(output_dir)
+
+    lines = []
     for comp_file in comparison_files:
-        # Parse comparison to get summary
-        with open(comp_file, "r") as f:
-            data = json.load(f)
-            comparison = HarborComparison.from_dict(data)
+        entry = index.get(comp_file.relative_to(output_dir).as_posix())
+        if entry is not None:
+            created = entry["created_at"]
+            delta_success = entry["success_rate_delta"]
+            delta_duration = entry["avg_duration_delta_pct"]
+        else:
+            # Not indexed (e.g. written by an older version): parse the file
+            comparison = HarborComparison.from_dict(
+                fast_json.loads(comp_file.read_bytes())
+            )
+            created = comparison.created_at
+            delta_success = comparison.deltas["success_rate_delta"]
+            delta_duration = comparison.deltas["avg_duration_delta_pct"]
 
-        created = comparison.created_at
-        delta_success = comparison.deltas["success_rate_delta"]
-        delta_duration = comparison.deltas["avg_duration_delta_pct"]
+        lines.append(f"  {comp_file.parent.name}/")
+        lines.append(f"    Created:      {created}")
+        lines.append(f"    Success Δ:    {delta_success:+.1f}%")
+        lines.append(f"    Duration Δ:   {delta_duration:+.1f}%")
+        lines.append("")
 
-        click.echo(f"  {comp_file.parent.name}/")
-        click.echo(f"    Created:      {created}")
-        click.echo(f"    Success Δ:    {delta_success:+.1f}%")
-        click.echo(f"    Duration Δ:   {delta_duration:+.1f}%")
-        click.echo()
+    # One write for the whole listing instead of five per comparison
+    click.echo("\n".join(lines))
 
 
 @harbor_cli.command(name="view")
@@ -344,9 +419,8 @@ def view_comparison(comparison_file: Path, format: str):
 
     COMPARISON_FILE: Path to comparison JSON file
     """
-    with open(comparison_file, "r") as f:
-        data = json.load(f)
-        comparison = HarborComparison.from_dict(data)
+    data = fast_json.loads(comparison_file.read_bytes())
+    comparison = HarborComparison.from_dict(data)
 
     if format == "summary":
         generator = DashboardGenerator()
@@ -354,7 +428,7 @@ def view_comparison(comparison_file: Path, format: str):
         click.echo(summary)
     else:
         # Full JSON output
-        click.echo(json.dumps(data, indent=2))
+        click.echo(fast_json.dumps_indented(data).decode("utf-8"))
 
 
 if __name__ == "__main__":
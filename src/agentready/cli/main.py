@@ -1,55 +1,41 @@
 """CLI entry point for agentready tool."""
 
-import json
+import os
 import sys
 from pathlib import Path
 
 import click
-
-try:
-    from importlib.metadata import version as get_version
-except ImportError:
-    # Python 3.7 compatibility
-    from importlib_metadata import version as get_version
-
 from pydantic import ValidationError
 
-from ..assessors import create_all_assessors
 from ..models.config import Config
 from ..reporters.html import HTMLReporter
 from ..reporters.markdown import MarkdownReporter
 from ..services.research_loader import ResearchLoader
 from ..services.scanner import Scanner
+from ..utils import fast_json
 from ..utils.security import (
     SENSITIVE_DIRS,
     VAR_SENSITIVE_SUBDIRS,
     _is_path_in_directory,
 )
 from ..utils.subprocess_utils import safe_subprocess_run
+from .version import get_agentready_version, version_text
 
-# Lightweight commands - imported immediately
-from .align import align
-from .benchmark import benchmark, validate_assessor
-from .bootstrap import bootstrap
-from .demo import demo
-from .repomix import repomix_generate
-from .research import research
-from .schema import migrate_report, validate_report
+# Subcommands defined in other modules are lazy loaded via LazyGroup
 
-# Heavy commands - lazy loaded via LazyGroup
-# (assess_batch, experiment, extract_skills, harbor, learn, submit)
+# Repositories with more files than this prompt before assessment
+LARGE_REPO_FILE_THRESHOLD = 10000
 
 
-def get_agentready_version() -> str:
-    """Get AgentReady version from package metadata.
+def create_all_assessors():
+    """Create all assessors, importing the assessor modules on first use.
 
-    Returns:
-        Version string (e.g., "1.0.0") or "unknown" if not installed
+    Only ``assess`` needs the assessors, and importing them is the largest
+    part of this module's own import cost.
     """
-    try:
-        return get_version("agentready")
-    except Exception:
-        return "unknown"
+    from ..assessors import create_all_assessors as _create_all_assessors
+
+    return _create_all_assessors()
 
 
 class LazyGroup(click.Group):
@@ -66,8 +52,8 @@ class LazyGroup(click.Group):
 
     def list_commands(self, ctx):
         """Return list of all command names (including lazy ones)."""
-        base_commands = super().list_commands(ctx)
-        return sorted(list(base_commands) + list(self.lazy_subcommands.keys()))
+        # Loaded lazy commands are also in self.commands; the union dedupes them
+        return sorted(self.commands.keys() | self.lazy_subcommands.keys())
 
     def get_command(self, ctx, cmd_name):
         """Load command on-demand."""
@@ -94,12 +80,21 @@ class LazyGroup(click.Group):
     invoke_without_command=True,
     cls=LazyGroup,
     lazy_subcommands={
+        "align": ("align", "align"),
         "assess-batch": ("assess_batch", "assess_batch"),
+        "benchmark": ("benchmark", "benchmark"),
+        "bootstrap": ("bootstrap", "bootstrap"),
+        "demo": ("demo", "demo"),
         "experiment": ("experiment", "experiment"),
         "extract-skills": ("extract_skills", "extract_skills"),
         "harbor": ("harbor", "harbor_cli"),
         "learn": ("learn", "learn"),
+        "migrate-report": ("schema", "migrate_report"),
+        "repomix-generate": ("repomix", "repomix_generate"),
+        "research": ("research", "research"),
         "submit": ("submit", "submit"),
+        "validate-assessor": ("benchmark", "validate_assessor"),
+        "validate-report": ("schema", "validate_report"),
     },
 )
 @click.option("--version", is_flag=True, help="Show version information")
@@ -213,21 +208,23 @@ def run_assessment(
         # Quick file count using git ls-files (if it's a git repo) or fallback
         # Security: Use safe_subprocess_run for validation and limits
         result = safe_subprocess_run(
-            ["git", "ls-files"],
+            ["git", "ls-files", "-z"],
             cwd=repo_path,
             capture_output=True,
-            text=True,
             timeout=5,
         )
         if result.returncode == 0:
-            file_count = len(result.stdout.splitlines())
+            # Count NUL terminators on raw bytes; no need to decode the paths
+            file_count = result.stdout.count(b"\0")
+            count_text = f"{file_count:,}"
         else:
-            # Not a git repo, use glob (slower but works)
-            file_count = sum(1 for _ in repo_path.rglob("*") if _.is_file())
+            # Not a git repo: walk the tree, stopping once past the threshold
+            file_count = _count_files(repo_path, LARGE_REPO_FILE_THRESHOLD + 1)
+            count_text = f"more than {LARGE_REPO_FILE_THRESHOLD:,}"
 
-        if file_count > 10000:
+        if file_count > LARGE_REPO_FILE_THRESHOLD:
             click.confirm(
-                f"⚠️  Warning: Large repository detected ({file_count:,} files). "
+                f"⚠️  Warning: Large repository detected ({count_text} files). "
                 "Assessment may take several minutes. Continue?",
                 abort=True,
             )
@@ -269,16 +266,17 @@ def run_assessment(
 
     # Validate exclusions (strict mode)
     if exclude:
+        excluded = set(exclude)
         valid_ids = {a.attribute_id for a in all_assessors}
-        invalid_ids = set(exclude) - valid_ids
+        invalid_ids = excluded - valid_ids
         if invalid_ids:
             raise click.BadParameter(
                 f"Invalid attribute ID(s): {', '.join(sorted(invalid_ids))}. "
                 f"Valid IDs: {', '.join(sorted(valid_ids))}"
             )
         # Filter out excluded assessors
-        assessors = [a for a in all_assessors if a.attribute_id not in exclude]
-        if verbose and exclude:
+        assessors = [a for a in all_assessors if a.attribute_id not in excluded]
+        if verbose:
             click.echo(
                 f"Excluded {len(exclude)} attribute(s): {', '.join(sorted(exclude))}\n"
             )
@@ -307,8 +305,7 @@ def run_assessment(
 
     # Save JSON output
     json_file = output_path / f"assessment-{timestamp}.json"
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(assessment.to_dict(), f, indent=2)
+    json_file.write_bytes(fast_json.dumps_indented(assessment.to_dict()))
 
     # Generate HTML report
     html_reporter = HTMLReporter()
@@ -330,15 +327,7 @@ def run_assessment(
         (latest_html, html_file),
         (latest_md, markdown_file),
     ]:
-        if latest.exists():
-            latest.unlink()
-        try:
-            latest.symlink_to(target.name)
-        except OSError:
-            # Windows doesn't support symlinks easily, just copy
-            import shutil
-
-            shutil.copy(target, latest)
+        _point_latest_at(latest, target)
 
     if verbose:
         click.echo(f"\n{'=' * 50}")
@@ -401,6 +390,49 @@ def run_assessment(
     click.echo(f"  Markdown: {markdown_file}")
 
 
+def _count_files(root: Path, limit: int) -> int:
+    """Count files under root, stopping as soon as limit is reached.
+
+    Uses os.scandir so file types come from the directory entries instead of
+    a stat() per path. Unreadable directories are skipped.
+    """
+    count = 0
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        count += 1
+                        if count >= limit:
+                            return count
+        except OSError:
+            continue
+    return count
+
+
+def _point_latest_at(latest: Path, target: Path) -> None:
+    """Point a "latest" link at target, falling back to a copy.
+
+    The new symlink is created under a temporary name and renamed over the
+    old one, so readers never see the link missing and a dangling link from
+    a deleted report is replaced like any other.
+    """
+    tmp = latest.with_name(f".{latest.name}.tmp")
+    try:
+        tmp.unlink(missing_ok=True)
+        tmp.symlink_to(target.name)
+        os.replace(tmp, latest)
+    except OSError:
+        # Windows doesn't support symlinks easily, just copy
+        import shutil
+
+        latest.unlink(missing_ok=True)
+        shutil.copyfile(target, latest)
+
+
 def load_config(config_path: Path) -> Config:
     """Load configuration from YAML file with Pydantic validation.
 
@@ -423,9 +455,15 @@ def load_config(config_path: Path) -> Config:
     """
     import yaml
 
+    # libyaml's loader accepts the same safe subset, several times faster
+    try:
+        from yaml import CSafeLoader as YAMLSafeLoader
+    except ImportError:
+        from yaml import SafeLoader as YAMLSafeLoader
+
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAMLSafeLoader)
 
         # Validate that data is a dictionary
         if not isinstance(data, dict):
@@ -541,18 +579,11 @@ def generate_config():
     click.echo("Edit this file to customize weights and behavior.")
 
 
-# Register lightweight commands (heavy commands loaded lazily via LazyGroup)
-cli.add_command(align)
-cli.add_command(benchmark)
-cli.add_command(validate_assessor)
-cli.add_command(bootstrap)
-cli.add_command(demo)
-cli.add_command(migrate_report)
-cli.add_command(repomix_generate)
-cli.add_command(research)
-cli.add_command(validate_report)
 # Lazy-loaded commands (not registered here):
+#   - align, bootstrap, demo, migrate-report, repomix-generate, research,
+#     validate-report (service layers only needed when invoked)
 #   - assess-batch (imports pandas)
+#   - benchmark, validate-assessor (import eval harness and Harbor services)
 #   - experiment (imports scipy, pandas)
 #   - extract-skills (imports anthropic)
 #   - learn (imports anthropic)
@@ -561,16 +592,7 @@ cli.add_command(validate_report)
 
 def show_version():
     """Show version information."""
-    version = get_agentready_version()
-    click.echo(f"AgentReady v{version}")
-
-    # Load research report date
-    try:
-        loader = ResearchLoader()
-        _, metadata, _, _, _ = loader.load_and_validate()
-        click.echo(f"Research Report: {metadata.date}")
-    except Exception:
-        click.echo("Research Report: unknown")
+    click.echo(version_text())
 
 
 if __name__ == "__main__":
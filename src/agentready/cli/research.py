@@ -278,7 +278,7 @@ def format(report_path, check, verbose):
                 click.echo("❌ Research report needs formatting")
                 click.echo("   Run without --check to apply changes")
                 sys.exit(1)
-        else:
+        elif formatted_content != content:
             # Apply formatting
             with open(report_file, "w", encoding="utf-8") as f:
                 f.write(formatted_content)
@@ -296,6 +296,9 @@ def format(report_path, check, verbose):
                 click.echo("".join(diff))
 
             click.echo(f"✅ Formatted: {report_file}")
+        else:
+            # Leave an already formatted file (and its mtime) untouched
+            click.echo("✅ Research report is properly formatted")
 
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -0,0 +1,35 @@
+"""Version information shared by the CLI and the console-script entry point.
+
+Kept free of the Click command modules so ``agentready --version`` can be
+answered without importing them.
+"""
+
+from importlib.metadata import version as get_version
+
+
+def get_agentready_version() -> str:
+    """Get AgentReady version from package metadata.
+
+    Returns:
+        Version string (e.g., "1.0.0") or "unknown" if not installed
+    """
+    try:
+        return get_version("agentready")
+    except Exception:
+        return "unknown"
+
+
+def version_text() -> str:
+    """Build the ``--version`` output: package version and research date."""
+    from ..services.research_loader import ResearchLoader
+
+    lines = [f"AgentReady v{get_agentready_version()}"]
+
+    # Load research report date
+    try:
+        _, metadata, _, _, _ = ResearchLoader().load_and_validate()
+        lines.append(f"Research Report: {metadata.date}")
+    except Exception:
+        lines.append("Research Report: unknown")
+
+    return "\n".join(lines)
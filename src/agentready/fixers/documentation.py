@@ -2,6 +2,7 @@
 
 import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -18,8 +19,12 @@ ANTHROPIC_API_KEY_ENV = "ANTHROPIC_API_KEY"
 CLAUDE_MD_REDIRECT_LINE = "@AGENTS.md\n"
 
 
+@lru_cache(maxsize=1)
 def _claude_md_command() -> str:
-    """Build Claude CLI command with prompt loaded from resources (safe shell quoting)."""
+    """Build Claude CLI command with prompt loaded from resources (safe shell quoting).
+
+    The prompt is a packaged resource, so the command is built once per process.
+    """
     import shlex
 
     prompt = load_prompt("claude_md_generator")
@@ -168,17 +173,20 @@ class CLAUDEmdFixer(BaseFixer):
         )
 
 
+@lru_cache(maxsize=4)
+def _load_template_lines(path: Path) -> tuple[str, ...] | None:
+    """Read a packaged template's lines once per process (None if missing)."""
+    if not path.exists():
+        return None
+    return tuple(path.read_text(encoding="utf-8").splitlines())
+
+
 class GitignoreFixer(BaseFixer):
     """Fixer for incomplete .gitignore."""
 
-    def __init__(self):
-        """Initialize fixer."""
-        self.template_path = (
-            Path(__file__).parent.parent
-            / "templates"
-            / "align"
-            / "gitignore_additions.txt"
-        )
+    template_path = (
+        Path(__file__).parent.parent / "templates" / "align" / "gitignore_additions.txt"
+    )
 
     @property
     def attribute_id(self) -> str:
@@ -195,11 +203,10 @@ class GitignoreFixer(BaseFixer):
             return None
 
         # Load recommended patterns
-        if not self.template_path.exists():
+        additions = _load_template_lines(self.template_path)
+        if additions is None:
             return None
 
-        additions = self.template_path.read_text(encoding="utf-8").splitlines()
-
         # Import FileModificationFix
         from ..models.fix import FileModificationFix
 
@@ -209,7 +216,7 @@ class GitignoreFixer(BaseFixer):
             description="Add recommended patterns to .gitignore",
             points_gained=self.estimate_score_improvement(finding),
             file_path=Path(".gitignore"),
-            additions=additions,
+            additions=list(additions),
             repository_path=repository.path,
             append=False,  # Smart merge to avoid duplicates
         )
@@ -91,9 +91,10 @@ class PatternExtractor:
             List of discovered skills for specified attributes
         """
         discovered_skills = []
+        wanted_ids = set(attribute_ids)
 
         for finding in self.assessment.findings:
-            if finding.attribute.id in attribute_ids and self._should_extract_pattern(
+            if finding.attribute.id in wanted_ids and self._should_extract_pattern(
                 finding
             ):
                 skill = self._create_skill_from_finding(finding)
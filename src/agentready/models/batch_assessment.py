@@ -138,13 +138,18 @@ class BatchAssessment:
             return 0.0
         return (self.summary.successful_assessments / len(self.results)) * 100
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+    def to_dict(self, include_results: bool = True) -> dict:
+        """Convert to dictionary for JSON serialization.
+
+        Args:
+            include_results: When False, "results" is left empty so callers
+                can serialize results one at a time
+        """
         return {
             "schema_version": self.schema_version,
             "batch_id": self.batch_id,
             "timestamp": self.timestamp.isoformat(),
-            "results": [r.to_dict() for r in self.results],
+            "results": ([r.to_dict() for r in self.results] if include_results else []),
             "summary": self.summary.to_dict(),
             "total_duration_seconds": self.total_duration_seconds,
             "success_rate": self.get_success_rate(),
@@ -1,9 +1,12 @@
 """Repository model representing the target git repository being assessed."""
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, fields
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ..utils.fs_cache import FSCache
 from ..utils.privacy import sanitize_path, shorten_commit_hash
 
 if TYPE_CHECKING:
@@ -36,6 +39,11 @@ class Repository:
     total_lines: int
     config: "Config | None" = None
 
+    # Directories never walked when listing Python files
+    PYTHON_SCAN_EXCLUDED_DIRS = frozenset(
+        {".git", ".venv", "venv", "node_modules", "__pycache__"}
+    )
+
     def __post_init__(self):
         """Validate repository data after initialization."""
         # Convert string paths to Path objects for runtime type safety
@@ -54,6 +62,14 @@ class Repository:
         if self.total_lines < 0:
             raise ValueError(f"Total lines must be non-negative: {self.total_lines}")
 
+    def __getstate__(self) -> dict:
+        """Pickle only the dataclass fields, dropping cached filesystem scans.
+
+        The cached properties hold os.DirEntry objects, which can't be
+        pickled, and are rebuilt on demand (e.g. in batch worker processes).
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
     def get_sanitized_path(self) -> str:
         """Get sanitized path for public display.
 
@@ -85,6 +101,128 @@ class Repository:
             return "Unknown"
         return max(self.languages, key=self.languages.get)
 
+    @cached_property
+    def path_str(self) -> str:
+        """Get the repository path as a plain string.
+
+        Lets assessors build file paths with ``os.path.join`` rather than
+        allocating a new Path per probe.
+
+        Returns:
+            Filesystem path of the repository root
+        """
+        return os.fspath(self.path)
+
+    @cached_property
+    def fs(self) -> FSCache:
+        """Get the filesystem lookup cache shared by all assessors.
+
+        Returns:
+            FSCache scoped to this Repository
+        """
+        return FSCache()
+
+    @property
+    def root_dir_entries(self) -> dict[str, os.DirEntry]:
+        """Get entries directly under the repository root, keyed by name.
+
+        Listed once with ``os.scandir`` through the shared FSCache, so
+        assessors can answer root-level checks with dict lookups instead of
+        one ``exists()`` syscall per probe.
+
+        Returns:
+            Mapping of entry name to DirEntry (empty if unreadable)
+        """
+        return self.fs.listdir(self.path)
+
+    @cached_property
+    def top_level_dirs(self) -> frozenset[str]:
+        """Get names of directories directly under the repository root.
+
+        Returns:
+            Frozen set of directory names (symlinks to directories included)
+        """
+        return frozenset(
+            name for name, entry in self.root_dir_entries.items() if entry.is_dir()
+        )
+
+    @cached_property
+    def github_dir_contents(self) -> dict[str, os.DirEntry]:
+        """Get entries of the .github/ directory keyed by lower-cased name.
+
+        GitHub matches template and workflow names case-insensitively.
+
+        Returns:
+            Mapping of lower-cased entry name to DirEntry (empty if missing)
+        """
+        listing = self.fs.listdir(self.path / ".github")
+        return {name.lower(): entry for name, entry in listing.items()}
+
+    @cached_property
+    def python_files(self) -> tuple[os.DirEntry, ...]:
+        """Get every .py file in the repository, walked once and cached.
+
+        Directories in PYTHON_SCAN_EXCLUDED_DIRS are pruned before
+        descending and entry types come from the directory listing, so
+        virtualenvs and node_modules are never walked.
+
+        Returns:
+            Tuple of DirEntry objects for Python files
+        """
+        excluded_dirs = self.PYTHON_SCAN_EXCLUDED_DIRS
+        py_files = []
+
+        stack = [str(self.path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in excluded_dirs:
+                                stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            py_files.append(entry)
+            except OSError:
+                continue
+
+        return tuple(py_files)
+
+    @cached_property
+    def readme_bytes(self) -> bytes | None:
+        """Get the raw contents of README.md, read at most once.
+
+        Returns:
+            README.md bytes, or None if the file does not exist
+
+        Raises:
+            OSError: If README.md exists but cannot be read (not cached)
+        """
+        try:
+            with open(self.path / "README.md", "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @cached_property
+    def readme_text(self) -> str | None:
+        """Get README.md decoded as UTF-8 with universal newlines.
+
+        Matches what ``open(path, encoding="utf-8").read()`` returns, but
+        shares one read of the file between assessors.
+
+        Returns:
+            README.md text, or None if the file does not exist
+
+        Raises:
+            OSError: If README.md exists but cannot be read (not cached)
+            UnicodeDecodeError: If README.md is not valid UTF-8 (not cached)
+        """
+        readme_bytes = self.readme_bytes
+        if readme_bytes is None:
+            return None
+        text = readme_bytes.decode("utf-8")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
     def to_dict(self, privacy_mode: bool = False) -> dict:
         """Convert to dictionary for JSON serialization.
 
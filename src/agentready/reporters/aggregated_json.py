@@ -1,9 +1,9 @@
 """Aggregated JSON reporter for batch assessments."""
 
-import json
 from pathlib import Path
 
 from ..models.batch_assessment import BatchAssessment
+from ..utils import fast_json
 
 
 class AggregatedJSONReporter:
@@ -34,7 +34,42 @@ class AggregatedJSONReporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(batch_assessment.to_dict(), f, indent=2, default=str)
+        # Results are serialized one at a time so only a single result's
+        # dict is held in memory, rather than every finding of the batch
+        envelope = batch_assessment.to_dict(include_results=False)
+
+        with open(output_path, "wb") as f:
+            f.write(b"{")
+            for i, (key, value) in enumerate(envelope.items()):
+                f.write(b",\n  " if i else b"\n  ")
+                f.write(self._dumps(key))
+                f.write(b": ")
+                if key == "results":
+                    self._write_results(f, batch_assessment)
+                else:
+                    f.write(self._dumps(value).replace(b"\n", b"\n  "))
+            f.write(b"\n}")
 
         return output_path
+
+    def _write_results(self, f, batch_assessment: BatchAssessment) -> None:
+        """Write the results array, serializing each result separately."""
+        if not batch_assessment.results:
+            f.write(b"[]")
+            return
+
+        f.write(b"[")
+        for i, result in enumerate(batch_assessment.results):
+            f.write(b",\n    " if i else b"\n    ")
+            f.write(self._dumps(result.to_dict()).replace(b"\n", b"\n    "))
+        f.write(b"\n  ]")
+
+    @staticmethod
+    def _dumps(obj) -> bytes:
+        """Serialize one value as 2-space indented JSON.
+
+        JSON strings cannot contain raw newlines, so callers can re-indent
+        the output for nesting by replacing newlines.
+        """
+        # Datetimes go through default=str whichever encoder is used
+        return fast_json.dumps_indented(obj, default=str)
@@ -1,6 +1,7 @@
 """Batch assessment orchestrator for multiple repositories."""
 
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
@@ -57,6 +58,7 @@ class BatchScanner:
         use_cache: bool = True,
         verbose: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        jobs: int = 1,
     ) -> BatchAssessment:
         """Scan multiple repositories and generate batch assessment.
 
@@ -66,26 +68,42 @@ class BatchScanner:
             config: Custom configuration
             use_cache: Whether to use cached results
             verbose: Verbose output
-            progress_callback: Callback function(current, total) for progress tracking
+            progress_callback: Callback function(current, total) for progress
+                tracking; called with the 0-based index before each repository
+                when jobs is 1, and with the number completed after each one
+                otherwise
+            jobs: Number of worker processes; 1 assesses repositories in order
+                in this process
 
         Returns:
-            BatchAssessment with results and summary
+            BatchAssessment with results and summary (in input order)
         """
         start_time = time.time()
-        results = []
 
-        for i, url in enumerate(repository_urls):
-            if progress_callback:
-                progress_callback(i, len(repository_urls))
-
-            result = self._assess_single_repository(
-                url,
+        if jobs > 1 and len(repository_urls) > 1:
+            results = self._scan_parallel(
+                repository_urls,
                 assessors,
                 config,
                 use_cache,
                 verbose,
+                progress_callback,
+                jobs,
             )
-            results.append(result)
+        else:
+            results = []
+            for i, url in enumerate(repository_urls):
+                if progress_callback:
+                    progress_callback(i, len(repository_urls))
+
+                result = self._assess_single_repository(
+                    url,
+                    assessors,
+                    config,
+                    use_cache,
+                    verbose,
+                )
+                results.append(result)
 
         # Calculate summary statistics
         summary = self._calculate_summary(results)
@@ -103,6 +121,73 @@ class BatchScanner:
 
         return batch
 
+    def _scan_parallel(
+        self,
+        repository_urls: list[str],
+        assessors: list,
+        config,
+        use_cache: bool,
+        verbose: bool,
+        progress_callback: Callable[[int, int], None] | None,
+        jobs: int,
+    ) -> list[RepositoryResult]:
+        """Assess repositories in a process pool.
+
+        Each worker builds its own BatchScanner over the same cache directory,
+        so clones and cached assessments are shared with serial runs.
+
+        Args:
+            repository_urls: List of repository URLs or local paths
+            assessors: List of assessor instances (pickled to each worker)
+            config: Custom configuration
+            use_cache: Use cached results if available
+            verbose: Verbose output
+            progress_callback: Called with (completed, total) after each result
+                arrives; unlike the serial path, completed counts from 1
+            jobs: Maximum number of worker processes
+
+        Returns:
+            RepositoryResult list in the same order as repository_urls
+        """
+        total = len(repository_urls)
+        results: list[RepositoryResult | None] = [None] * total
+
+        with ProcessPoolExecutor(max_workers=min(jobs, total)) as executor:
+            future_to_index = {
+                executor.submit(
+                    _assess_repository_in_worker,
+                    self.cache_dir,
+                    self.batch_id,
+                    self.version,
+                    self.command,
+                    url,
+                    assessors,
+                    config,
+                    use_cache,
+                    verbose,
+                ): i
+                for i, url in enumerate(repository_urls)
+            }
+
+            for completed, future in enumerate(as_completed(future_to_index), start=1):
+                i = future_to_index[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    # Worker crashed or result could not be sent back
+                    results[i] = RepositoryResult(
+                        repository_url=repository_urls[i],
+                        assessment=None,
+                        error=f"Unexpected error: {e}",
+                        error_type="assessment_error",
+                        duration_seconds=0.0,
+                    )
+
+                if progress_callback:
+                    progress_callback(completed, total)
+
+        return results
+
     def _assess_single_repository(
         self,
         url: str,
@@ -241,3 +326,21 @@ class BatchScanner:
             language_breakdown=language_breakdown,
             top_failing_attributes=top_failing_attributes,
         )
+
+
+def _assess_repository_in_worker(
+    cache_dir: Path,
+    batch_id: str,
+    version: str,
+    command: str,
+    url: str,
+    assessors: list,
+    config,
+    use_cache: bool,
+    verbose: bool,
+) -> RepositoryResult:
+    """Assess one repository in a worker process (see BatchScanner._scan_parallel)."""
+    scanner = BatchScanner(
+        cache_dir=cache_dir, batch_id=batch_id, version=version, command=command
+    )
+    return scanner._assess_single_repository(url, assessors, config, use_cache, verbose)
@@ -1,5 +1,7 @@
 """Utility modules for AgentReady."""
 
+from .fs_cache import FSCache
+from .manifest_cache import load_package_json, load_pyproject, read_manifest_text
 from .preflight import PreflightError, check_harbor_cli, ensure_terminal_bench_dataset
 from .privacy import (
     sanitize_command_args,
@@ -17,6 +19,10 @@ from .subprocess_utils import (
 )
 
 __all__ = [
+    "FSCache",
+    "load_package_json",
+    "load_pyproject",
+    "read_manifest_text",
     "safe_subprocess_run",
     "sanitize_subprocess_error",
     "validate_repository_path",
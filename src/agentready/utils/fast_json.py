@@ -0,0 +1,53 @@
+"""JSON encoding and decoding with orjson when it is installed.
+
+orjson is optional (``pip install agentready[fast]``). Without it the
+standard library is used, configured so that both paths write the same
+bytes: 2-space indentation, UTF-8 output with non-ASCII left unescaped,
+and datetimes passed to ``default`` rather than encoded natively.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_indented(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON.
+
+    Args:
+        obj: Value to serialize
+        default: Called for objects JSON can't encode (as in json.dumps)
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error
+            subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,64 @@
+"""Per-repository cache for filesystem lookups shared across assessors.
+
+Many assessors probe the same paths during one assessment (README.md,
+Makefile, .github/...). Caching the answers turns repeated probes into
+dict lookups instead of stat syscalls.
+"""
+
+import os
+from pathlib import Path
+
+
+class FSCache:
+    """Memoizes filesystem existence checks for a single assessment.
+
+    Results are cached for the lifetime of the cache (one Repository, i.e.
+    one scan). Paths created or removed afterwards are not noticed, so a new
+    Repository should be built after modifying the tree (e.g. after fixes).
+    """
+
+    def __init__(self):
+        """Initialize empty cache."""
+        self._exists: dict[str, bool] = {}
+        self._listings: dict[str, dict[str, os.DirEntry]] = {}
+
+    def exists(self, path: Path | str) -> bool:
+        """Check whether a path exists, following symlinks like Path.exists().
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the path exists
+        """
+        key = os.fspath(path)
+        try:
+            return self._exists[key]
+        except KeyError:
+            result = self._exists[key] = os.path.exists(key)
+            return result
+
+    def listdir(self, path: Path | str) -> dict[str, os.DirEntry]:
+        """List a directory once with os.scandir and cache the entries.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Mapping of entry name to DirEntry; empty if the directory is
+            missing or unreadable
+        """
+        key = os.fspath(path)
+        try:
+            return self._listings[key]
+        except KeyError:
+            pass
+
+        try:
+            with os.scandir(key) as entries:
+                listing = {entry.name: entry for entry in entries}
+        except OSError:
+            listing = {}
+
+        self._listings[key] = listing
+        return listing
@@ -0,0 +1,92 @@
+"""Process-wide cache for project manifests read by several assessors.
+
+pyproject.toml and package.json are read by the coverage, security and
+dependency assessors alike. Caching by (path, mtime, size) reads and parses
+each manifest once per process while still noticing edits (e.g. after fixes).
+"""
+
+import codecs
+import os
+import tomllib
+from functools import lru_cache
+from pathlib import Path
+
+from . import fast_json
+
+
+def read_manifest_text(path: Path | str) -> str:
+    """Read a manifest file as UTF-8 text, cached by path, mtime and size.
+
+    Args:
+        path: Manifest file to read
+
+    Returns:
+        File contents
+
+    Raises:
+        OSError: If the file is missing or unreadable
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    return _read_text(key, st.st_mtime_ns, st.st_size)
+
+
+def load_package_json(path: Path | str) -> dict:
+    """Parse a package.json file, cached by path, mtime and size.
+
+    The returned dict is shared between callers and must not be modified.
+
+    Args:
+        path: package.json file to parse
+
+    Returns:
+        Parsed JSON document
+
+    Raises:
+        OSError: If the file is missing or unreadable
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    return _load_json(key, st.st_mtime_ns, st.st_size)
+
+
+def load_pyproject(path: Path | str) -> dict:
+    """Parse a pyproject.toml file, cached by path, mtime and size.
+
+    The returned dict is shared between callers and must not be modified.
+
+    Args:
+        path: pyproject.toml file to parse
+
+    Returns:
+        Parsed TOML document
+
+    Raises:
+        OSError: If the file is missing or unreadable
+        tomllib.TOMLDecodeError: If the file is not valid TOML
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    return _load_toml(key, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _read_text(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=256)
+def _load_json(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path, "rb") as f:
+        data = f.read()
+    # Editors on Windows often save package.json with a UTF-8 BOM
+    data = data.removeprefix(codecs.BOM_UTF8)
+    return fast_json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _load_toml(path: str, mtime_ns: int, size: int) -> dict:
+    return tomllib.loads(_read_text(path, mtime_ns, size))
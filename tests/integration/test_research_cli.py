@@ -1,5 +1,6 @@
 """Integration tests for research CLI commands."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -312,6 +313,18 @@ class TestFormatCommand:
         finally:
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_format_skips_write_when_already_formatted(self, cli_runner, tmp_path):
+        """Test that formatting an already formatted report doesn't rewrite it."""
+        report = tmp_path / "report.md"
+        report.write_text("# Title\n\nContent\n", encoding="utf-8")
+        os.utime(report, ns=(0, 0))
+
+        result = cli_runner.invoke(research, ["format", str(report)])
+
+        assert result.exit_code == 0
+        assert "✅ Research report is properly formatted" in result.output
+        assert report.stat().st_mtime_ns == 0
+
     def test_format_check_mode(self, cli_runner):
         """Test format check mode."""
         # Create properly formatted report
@@ -0,0 +1,76 @@
+"""Unit tests for assess-batch CLI helpers."""
+
+import json
+from datetime import datetime
+
+from agentready.cli.assess_batch import _generate_multi_reports, _load_config
+from agentready.models import BatchAssessment, BatchSummary, RepositoryResult
+
+
+class TestLoadConfig:
+    """Test batch config loading."""
+
+    def test_load_config(self, tmp_path):
+        """Test that a YAML config is parsed into a validated Config."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("excluded_attributes:\n  - claude_md_file\n")
+
+        assert _load_config(config_file).excluded_attributes == ["claude_md_file"]
+
+
+def _failed_batch():
+    result = RepositoryResult(
+        repository_url="https://github.com/user/broken",
+        assessment=None,
+        error="Clone failed",
+        error_type="clone_error",
+        duration_seconds=1.5,
+    )
+    return BatchAssessment(
+        batch_id="test-batch",
+        timestamp=datetime(2025, 1, 22, 14, 30, 22),
+        results=[result],
+        summary=BatchSummary(
+            total_repositories=1,
+            successful_assessments=0,
+            failed_assessments=1,
+            average_score=0.0,
+        ),
+        total_duration_seconds=1.5,
+    )
+
+
+class TestGenerateMultiReports:
+    """Test batch report generation."""
+
+    def test_writes_reports_in_stable_order(self, tmp_path, capsys):
+        """Test that concurrently written reports are listed in order."""
+        _generate_multi_reports(_failed_batch(), tmp_path, verbose=True)
+
+        reports_dir = tmp_path / "reports-20250122-143022"
+        failures = json.loads((reports_dir / "failures.json").read_text())
+        assert failures[0]["error_type"] == "clone_error"
+        assert (reports_dir / "all-assessments.json").exists()
+        assert (reports_dir / "summary.csv").exists()
+
+        out = capsys.readouterr().out
+        written = [
+            line.strip()[2:] for line in out.splitlines() if line.startswith("  ✓")
+        ]
+        assert written[:3] == ["summary.csv", "summary.tsv", "all-assessments.json"]
+        assert written[-1] == "failures.json"
+
+    def test_failed_report_does_not_stop_others(self, tmp_path, capsys, monkeypatch):
+        """Test that one reporter failing is reported and others still write."""
+        from agentready.reporters.csv_reporter import CSVReporter
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(CSVReporter, "generate", fail)
+
+        _generate_multi_reports(_failed_batch(), tmp_path, verbose=False)
+
+        reports_dir = tmp_path / "reports-20250122-143022"
+        assert (reports_dir / "failures.json").exists()
+        assert "CSV generation failed: disk full" in capsys.readouterr().err
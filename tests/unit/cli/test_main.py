@@ -3,6 +3,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -572,6 +573,66 @@ class TestHelperFunctions:
         assert result.exit_code == 0
         assert "AgentReady" in result.output
 
+    def test_entry_point_version_fast_path(self, runner, capsys, monkeypatch):
+        """Test that the console script answers --version without Click."""
+        from agentready.cli.entry import main
+
+        monkeypatch.setattr("sys.argv", ["agentready", "--version"])
+        with patch("agentready.cli.main.cli") as mock_cli:
+            main()
+
+        mock_cli.assert_not_called()
+        assert capsys.readouterr().out == runner.invoke(cli, ["--version"]).output
+
+    def test_entry_point_delegates_to_cli(self, monkeypatch):
+        """Test that other invocations go through the Click group."""
+        from agentready.cli.entry import main
+
+        monkeypatch.setattr("sys.argv", ["agentready", "assess", "."])
+        with patch("agentready.cli.main.cli") as mock_cli:
+            main()
+
+        mock_cli.assert_called_once_with()
+
+    def test_list_commands_after_lazy_load(self):
+        """Test that loading a lazy command doesn't list it twice."""
+        ctx = click.Context(cli)
+        before = cli.list_commands(ctx)
+
+        assert cli.get_command(ctx, "align") is not None
+        assert cli.list_commands(ctx) == before
+        assert before == sorted(set(before))
+
+    def test_count_files_stops_at_limit(self, tmp_path):
+        """Test that the fallback file count walks subdirectories and stops early."""
+        from agentready.cli.main import _count_files
+
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        for name in ["x.py", "a/y.py", "a/b/z.py"]:
+            (tmp_path / name).write_text("")
+
+        assert _count_files(tmp_path, limit=100) == 3
+        assert _count_files(tmp_path, limit=2) == 2
+
+    def test_point_latest_at_replaces_existing_links(self, tmp_path):
+        """Test that latest links are swapped in, even over dangling ones."""
+        from agentready.cli.main import _point_latest_at
+
+        old = tmp_path / "report-1.md"
+        new = tmp_path / "report-2.md"
+        new.write_text("new")
+        latest = tmp_path / "report-latest.md"
+        latest.symlink_to(old.name)  # dangling: report-1.md was deleted
+
+        _point_latest_at(latest, new)
+
+        assert latest.is_symlink()
+        assert latest.read_text() == "new"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "report-2.md",
+            "report-latest.md",
+        ]
+
     def test_create_all_assessors(self):
         """Test create_all_assessors returns list."""
         assessors = create_all_assessors()
@@ -580,6 +641,14 @@ class TestHelperFunctions:
         # Should have all 25 assessors (implemented + stubs)
         assert len(assessors) >= 25
 
+    def test_create_all_assessors_reuses_instances(self):
+        """Test that assessors are shared but each call gets its own list."""
+        first = create_all_assessors()
+        second = create_all_assessors()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
 
 class TestSensitiveDirectoryWarning:
     """Test warning for sensitive directories."""
@@ -633,7 +702,7 @@ class TestLargeRepositoryWarning:
             with patch("agentready.cli.main.safe_subprocess_run") as mock_subprocess:
                 # Simulate large repo with 15000 files
                 mock_subprocess.return_value = MagicMock(
-                    returncode=0, stdout="\n".join(["file.py"] * 15000)
+                    returncode=0, stdout=b"file.py\0" * 15000
                 )
 
                 # Decline to continue
@@ -1,6 +1,13 @@
 """Tests for documentation assessors."""
 
-from agentready.assessors.documentation import CLAUDEmdAssessor
+import ast
+import json
+
+from agentready.assessors.documentation import (
+    CLAUDEmdAssessor,
+    InlineDocumentationAssessor,
+    OpenAPISpecsAssessor,
+)
 from agentready.models.repository import Repository
 
 
@@ -439,3 +446,203 @@ class TestCLAUDEmdAssessor:
         assert finding.status == "fail"
         assert finding.score == 25.0
         assert finding.remediation is not None
+
+
+class TestOpenAPISpecsAssessor:
+    """Test OpenAPISpecsAssessor."""
+
+    def _make_repo(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        return Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 100},
+            total_files=10,
+            total_lines=100,
+        )
+
+    def test_yaml_spec_counts_paths_and_schemas(self, tmp_path):
+        """Test that YAML specs are counted without nested bodies leaking in."""
+        (tmp_path / "openapi.yaml").write_text(
+            "openapi: 3.0.3\n"
+            "info:\n"
+            "  title: Test\n"
+            "  version: '1.0'\n"
+            "paths:\n"
+            "  /users:\n"
+            "    get:\n"
+            "      responses:\n"
+            "        '200':\n"
+            "          description: ok\n"
+            "  /users/{id}:\n"
+            "    get:\n"
+            "      parameters: [{name: id, in: path}]\n"
+            "components:\n"
+            "  securitySchemes:\n"
+            "    key: {type: apiKey}\n"
+            "  schemas:\n"
+            "    User:\n"
+            "      type: object\n"
+            "    Error:\n"
+            "      type: object\n"
+            "    Page:\n"
+            "      type: object\n"
+        )
+
+        finding = OpenAPISpecsAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.status == "pass"
+        assert finding.score == 100
+        assert "OpenAPI version: 3.0.3" in finding.evidence
+        assert "2 endpoints documented" in finding.evidence
+        assert "3 schemas defined" in finding.evidence
+
+    def test_json_swagger_spec_uses_definitions(self, tmp_path):
+        """Test that Swagger 2.0 JSON specs count definitions as schemas."""
+        (tmp_path / "swagger.json").write_text(
+            json.dumps(
+                {
+                    "swagger": "2.0",
+                    "paths": {"/a": {}, "/b": {}, "/c": {}},
+                    "definitions": {"A": {}},
+                }
+            )
+        )
+
+        finding = OpenAPISpecsAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.score == 90
+        assert "3 endpoints documented" in finding.evidence
+        assert "1 schemas defined" in finding.evidence
+
+    def test_quick_stats_without_paths(self, tmp_path):
+        """Test that empty paths and missing schemas are reported as such."""
+        spec = tmp_path / "openapi.yml"
+        spec.write_text("openapi: '3.1.0'\npaths: {}\ncomponents:\n  responses: {}\n")
+
+        stats = OpenAPISpecsAssessor()._quick_openapi_stats(spec)
+
+        assert stats == {"version": "3.1.0", "path_count": 0, "schema_count": None}
+
+    def test_specs_in_excluded_directories_are_ignored(self, tmp_path):
+        """Test that vendored specs under node_modules are not counted."""
+        vendored = tmp_path / "node_modules" / "pkg"
+        vendored.mkdir(parents=True)
+        (vendored / "openapi.yaml").write_text("openapi: 3.0.0\npaths: {}\n")
+
+        finding = OpenAPISpecsAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.status == "fail"
+        assert finding.score == 0
+
+    def test_invalid_yaml_returns_error(self, tmp_path):
+        """Test that unparseable specs produce an error finding."""
+        (tmp_path / "openapi.yaml").write_text("openapi: [3.0\npaths: {\n")
+
+        finding = OpenAPISpecsAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.status == "error"
+        assert "Could not parse openapi.yaml" in finding.error_message
+
+
+class TestInlineDocumentationAssessor:
+    """Test InlineDocumentationAssessor."""
+
+    def test_count_docstrings_skips_private_items(self):
+        """Test that private definitions are excluded from the counts."""
+        tree = ast.parse(
+            '"""Module docstring."""\n'
+            "def public():\n"
+            '    """Documented."""\n'
+            "def _private():\n"
+            "    pass\n"
+            "class Widget:\n"
+            "    def method(self):\n"
+            "        pass\n"
+        )
+
+        documented, total = InlineDocumentationAssessor()._count_docstrings(tree)
+
+        # module + public + Widget + method
+        assert total == 4
+        assert documented == 2
+
+    def test_assess_reports_coverage(self, tmp_path):
+        """Test coverage aggregation across files."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "a.py").write_text('"""Doc."""\ndef f():\n    """Doc."""\n')
+        (tmp_path / "b.py").write_text("def g():\n    pass\n")
+        repo = Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 2},
+            total_files=2,
+            total_lines=5,
+        )
+
+        finding = InlineDocumentationAssessor().assess(repo)
+
+        assert finding.measured_value == "50.0%"
+        assert "Documented items: 2/4" in finding.evidence
+
+    def test_has_docstring_matches_get_docstring(self):
+        """Test that the presence check agrees with ast.get_docstring."""
+        source = (
+            '"""Module."""\n'
+            "def a():\n"
+            '    """Doc."""\n'
+            "def b():\n"
+            '    """   """\n'
+            "def c():\n"
+            "    x = 1\n"
+            "def d():\n"
+            "    42\n"
+            "class E:\n"
+            '    f"not {a} docstring"\n'
+        )
+        tree = ast.parse(source)
+        assessor = InlineDocumentationAssessor()
+
+        definitions = [n for n in tree.body if not isinstance(n, ast.Expr)]
+        for node in [tree, *definitions]:
+            assert assessor._has_docstring(node) == bool(ast.get_docstring(node))
+
+    def test_count_docstrings_finds_nested_definitions(self):
+        """Test that definitions nested in compound statements are counted."""
+        tree = ast.parse(
+            "if True:\n"
+            "    def a():\n"
+            '        """Doc."""\n'
+            "else:\n"
+            "    def b(): pass\n"
+            "try:\n"
+            "    class C:\n"
+            "        def d(self): pass\n"
+            "except ValueError:\n"
+            "    def e(): pass\n"
+            "finally:\n"
+            "    def f(): pass\n"
+            "match x:\n"
+            "    case 1:\n"
+            "        def g():\n"
+            '            """Doc."""\n'
+            "            def h(): pass\n"
+            "with ctx:\n"
+            "    for i in y:\n"
+            "        while z:\n"
+            "            def i(): pass\n"
+        )
+        expected_total = 1 + sum(
+            isinstance(n, (ast.FunctionDef, ast.ClassDef)) for n in ast.walk(tree)
+        )
+
+        documented, total = InlineDocumentationAssessor()._count_docstrings(tree)
+
+        assert total == expected_total == 10
+        assert documented == 2
@@ -285,3 +285,29 @@ bandit = "^1.7.0"
             "npm/yarn audit" in finding.measured_value
             or "Snyk" in finding.measured_value
         )
+
+    def test_semgrep_workflow(self, tmp_path):
+        """Test that a Semgrep workflow counts and unrelated workflows don't."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+
+        workflows_dir = tmp_path / ".github" / "workflows"
+        workflows_dir.mkdir(parents=True)
+        (workflows_dir / "semgrep-scan.yaml").write_text("name: Semgrep\n")
+        (workflows_dir / "codeql-notes.txt").write_text("not a workflow\n")
+
+        repo = Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 100},
+            total_files=10,
+            total_lines=100,
+        )
+
+        finding = DependencySecurityAssessor().assess(repo)
+
+        assert finding.score == 15
+        assert any("Semgrep SAST in GitHub Actions" in e for e in finding.evidence)
+        assert not any("CodeQL" in e for e in finding.evidence)
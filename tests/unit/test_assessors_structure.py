@@ -1,6 +1,11 @@
 """Tests for structure assessors."""
 
-from agentready.assessors.structure import StandardLayoutAssessor
+from agentready.assessors.structure import (
+    IssuePRTemplatesAssessor,
+    OneCommandSetupAssessor,
+    SeparationOfConcernsAssessor,
+    StandardLayoutAssessor,
+)
 from agentready.models.repository import Repository
 
 
@@ -136,3 +141,268 @@ class TestStandardLayoutAssessor:
         evidence_str = " ".join(finding.evidence)
         assert "tests/" in evidence_str or "test/" in evidence_str
         assert "✓" in evidence_str  # Should show checkmark for test dir
+
+    def test_attribute_is_shared(self):
+        """Test that the attribute is built once per class, not per access."""
+        assessor = StandardLayoutAssessor()
+
+        assert assessor.attribute is StandardLayoutAssessor().attribute
+        assert assessor.attribute.id == assessor.attribute_id
+        assert assessor.attribute.tier == assessor.tier
+
+
+class TestOneCommandSetupAssessor:
+    """Test OneCommandSetupAssessor."""
+
+    def _make_repo(self, tmp_path, readme=None):
+        (tmp_path / ".git").mkdir()
+        if readme is not None:
+            (tmp_path / "README.md").write_text(readme)
+        return Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 100},
+            total_files=10,
+            total_lines=100,
+        )
+
+    def test_not_applicable_without_readme(self, tmp_path):
+        """Test that a missing README makes the check not applicable."""
+        finding = OneCommandSetupAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.status == "not_applicable"
+
+    def test_passes_with_prominent_setup_command(self, tmp_path):
+        """Test full score for a prominent command plus setup automation."""
+        repo = self._make_repo(
+            tmp_path,
+            "# Project\n\n## Installation\n\n```bash\nmake setup\n```\n",
+        )
+        (tmp_path / "Makefile").write_text("setup:\n\ttrue\n")
+
+        finding = OneCommandSetupAssessor().assess(repo)
+
+        assert finding.status == "pass"
+        assert finding.score == 100
+        assert finding.measured_value == "make setup"
+        assert "Setup automation found: Makefile" in finding.evidence
+
+    def test_only_readme_head_is_scanned(self, tmp_path):
+        """Test that setup commands past the scan cap are not considered."""
+        padding = "filler text\n" * (OneCommandSetupAssessor.README_SCAN_BYTES // 12)
+        repo = self._make_repo(tmp_path, "# Project\n\n" + padding + "npm install\n")
+
+        finding = OneCommandSetupAssessor().assess(repo)
+
+        assert finding.measured_value == "multi-step setup"
+
+    def test_find_setup_command(self):
+        """Test setup command extraction from README content."""
+        assessor = OneCommandSetupAssessor()
+
+        assert assessor._find_setup_command("npm install\n", {}) == "npm install"
+        assert assessor._find_setup_command("Run:\nuv sync\n", {}) == "uv sync"
+        assert assessor._find_setup_command("No commands here.\n", {}) == ""
+
+    def test_install_command_preferred_over_earlier_tool_command(self):
+        """Test that '<x> install' wins even when a tool command comes first."""
+        readme = "make build\nmake\npip install -e .\n"
+
+        assert OneCommandSetupAssessor()._find_setup_command(readme, {}) == (
+            "pip install"
+        )
+
+    def test_language_setup_command_found_at_line_start(self):
+        """Test that the repository's languages pick the literal command."""
+        assessor = OneCommandSetupAssessor()
+        readme = "Use `uv sync` inline.\nnpm install\n```bash\nuv sync\n```\n"
+
+        assert assessor._find_setup_command(readme, {"Python": 10}) == "uv sync"
+        assert assessor._find_setup_command(readme, {}) == "npm install"
+
+    def test_language_setup_command_matched_case_insensitively(self, tmp_path):
+        """Test that the literal lookup ignores case like the pattern does."""
+        repo = self._make_repo(
+            tmp_path, "# Project\n\n## Setup\n\nNpm install\nUV sync\n"
+        )
+
+        finding = OneCommandSetupAssessor().assess(repo)
+
+        assert "Setup command found in README: 'UV sync'" in finding.evidence
+
+    def test_setup_not_prominent_after_third_section(self):
+        """Test that setup keywords past the first sections don't count."""
+        readme = "# P\n## One\nx\n## Two\nx\n## Three\nx\n## Install\nx\n"
+
+        assert not OneCommandSetupAssessor()._is_setup_prominent(readme)
+
+
+class TestSeparationOfConcernsAssessor:
+    """Test SeparationOfConcernsAssessor."""
+
+    def _make_repo(self, tmp_path):
+        (tmp_path / ".git").mkdir(exist_ok=True)
+        return Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 100},
+            total_files=10,
+            total_lines=100,
+        )
+
+    def test_excluded_directories_are_pruned(self, tmp_path):
+        """Test that virtualenv and node_modules contents are ignored."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "core.py").write_text("x = 1\n")
+        for excluded in (".venv", "venv", "node_modules"):
+            (tmp_path / excluded / "lib").mkdir(parents=True)
+            (tmp_path / excluded / "lib" / "utils.py").write_text("x = 1\n" * 600)
+
+        finding = SeparationOfConcernsAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.status == "pass"
+        assert "File cohesion: 0/1 files >500 lines" in finding.evidence
+
+    def test_detects_catch_all_modules_and_large_files(self, tmp_path):
+        """Test that catch-all modules and oversized files are penalized."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "helpers.py").write_text("x = 1\n")
+        (tmp_path / "pkg" / "utils.py").write_text("x = 1\n" * 501)
+
+        finding = SeparationOfConcernsAssessor().assess(self._make_repo(tmp_path))
+
+        assert "File cohesion: 1/2 files >500 lines" in finding.evidence
+        assert "Anti-pattern files found: utils.py, helpers.py" in finding.evidence
+        assert "naming:60" in finding.measured_value
+
+    def test_layer_directories_checked_under_src(self, tmp_path):
+        """Test that layer directories are looked up in src/ when present."""
+        (tmp_path / "models").mkdir()
+        (tmp_path / "src" / "views").mkdir(parents=True)
+        (tmp_path / "src" / "services").mkdir()
+
+        assessor = SeparationOfConcernsAssessor()
+        _, _, found_layers = assessor._scan_repo_once(self._make_repo(tmp_path))
+
+        assert found_layers == ["views", "services"]
+        assert assessor._check_directory_organization(found_layers) == 70.0
+
+    def test_count_lines_matches_text_line_count(self, tmp_path):
+        """Test byte-level counting with and without a trailing newline."""
+        assessor = SeparationOfConcernsAssessor()
+        cases = {"empty.py": "", "one.py": "x = 1", "two.py": "a\nb\n"}
+        for name, content in cases.items():
+            (tmp_path / name).write_text(content)
+            expected = len(content.splitlines())
+            assert assessor._count_lines(str(tmp_path / name), 500) == expected
+
+    def test_count_lines_stops_past_limit(self, tmp_path):
+        """Test that counting stops once the limit is exceeded."""
+        big = tmp_path / "big.py"
+        big.write_text("x = 1\n" * 200_000)
+
+        lines = SeparationOfConcernsAssessor()._count_lines(str(big), 500)
+
+        assert 500 < lines < 200_000
+
+    def test_size_fast_path_keeps_exact_threshold(self, tmp_path):
+        """Test that the byte-size shortcut never misclassifies files."""
+        (tmp_path / "at_limit.py").write_text("\n" * 500)
+        (tmp_path / "over_limit.py").write_text("\n" * 501)
+
+        finding = SeparationOfConcernsAssessor().assess(self._make_repo(tmp_path))
+
+        assert "File cohesion: 1/2 files >500 lines" in finding.evidence
+
+    def test_cohesion_samples_large_trees(self, tmp_path, monkeypatch):
+        """Test that cohesion sizing is capped and the sample is reported."""
+        monkeypatch.setattr(SeparationOfConcernsAssessor, "MAX_COHESION_FILES", 2)
+        for i in range(5):
+            (tmp_path / f"mod{i}.py").write_text("x = 1\n")
+        # Sorted paths sampled at stride 3 are mod0.py and mod3.py
+        (tmp_path / "mod3.py").write_text("\n" * 501)
+
+        finding = SeparationOfConcernsAssessor().assess(self._make_repo(tmp_path))
+
+        assert (
+            "File cohesion: 1/2 files >500 lines (sampled from 5)" in finding.evidence
+        )
+
+    def test_cohesion_counts_match_in_thread_pool(self, tmp_path, monkeypatch):
+        """Test that pooled line counting gives the same totals."""
+        monkeypatch.setattr(SeparationOfConcernsAssessor, "PARALLEL_MIN_FILES", 1)
+        for i in range(6):
+            lines = 501 if i % 3 == 0 else 10
+            (tmp_path / f"mod{i}.py").write_text("x = 1\n" * lines)
+
+        finding = SeparationOfConcernsAssessor().assess(self._make_repo(tmp_path))
+
+        assert "File cohesion: 2/6 files >500 lines" in finding.evidence
+
+    def test_layer_check_ignores_files(self, tmp_path):
+        """Test that a file named like a layer directory is not a layer."""
+        (tmp_path / "models").write_text("not a package")
+        (tmp_path / "views").mkdir()
+
+        _, _, found_layers = SeparationOfConcernsAssessor()._scan_repo_once(
+            self._make_repo(tmp_path)
+        )
+
+        assert found_layers == ["views"]
+
+
+class TestIssuePRTemplatesAssessor:
+    """Test IssuePRTemplatesAssessor."""
+
+    def _make_repo(self, tmp_path):
+        (tmp_path / ".git").mkdir(exist_ok=True)
+        return Repository(
+            path=tmp_path,
+            name="test-repo",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 100},
+            total_files=10,
+            total_lines=100,
+        )
+
+    def test_passes_with_pr_and_issue_templates(self, tmp_path):
+        """Test full score with a PR template and two issue templates."""
+        issue_dir = tmp_path / ".github" / "ISSUE_TEMPLATE"
+        issue_dir.mkdir(parents=True)
+        (tmp_path / ".github" / "pull_request_template.md").write_text("## PR")
+        (issue_dir / "bug_report.md").write_text("bug")
+        (issue_dir / "feature.yml").write_text("name: feature")
+        (issue_dir / "notes.txt").write_text("ignored")
+
+        finding = IssuePRTemplatesAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.status == "pass"
+        assert finding.measured_value == "PR:True, Issues:2"
+
+    def test_root_pr_template_and_missing_issue_dir(self, tmp_path):
+        """Test a root-level PR template without issue templates."""
+        (tmp_path / "PULL_REQUEST_TEMPLATE.md").write_text("## PR")
+
+        finding = IssuePRTemplatesAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.score == 50
+        assert finding.measured_value == "PR:True, Issues:0"
+        assert "No issue template directory found" in finding.evidence
+
+    def test_issue_template_file_is_not_a_directory(self, tmp_path):
+        """Test that a file named ISSUE_TEMPLATE is not treated as templates."""
+        (tmp_path / ".github").mkdir()
+        (tmp_path / ".github" / "ISSUE_TEMPLATE").write_text("oops")
+
+        finding = IssuePRTemplatesAssessor().assess(self._make_repo(tmp_path))
+
+        assert finding.score == 0
+        assert finding.measured_value == "PR:False, Issues:0"
@@ -0,0 +1,171 @@
+"""Tests for testing assessors."""
+
+import pytest
+
+from agentready.assessors.testing import PreCommitHooksAssessor, TestCoverageAssessor
+from agentready.models.repository import Repository
+
+
+def _make_repo(tmp_path, languages=None):
+    (tmp_path / ".git").mkdir(exist_ok=True)
+    return Repository(
+        path=tmp_path,
+        name="test-repo",
+        url=None,
+        branch="main",
+        commit_hash="abc123",
+        languages=languages or {"Python": 100},
+        total_files=10,
+        total_lines=100,
+    )
+
+
+class TestTestCoverageAssessor:
+    """Test TestCoverageAssessor."""
+
+    def test_python_coverage_configured(self, tmp_path):
+        """Test full score with a coverage config and pytest-cov."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project.optional-dependencies]\ndev = ["pytest-cov"]\n'
+        )
+
+        finding = TestCoverageAssessor().assess(_make_repo(tmp_path))
+
+        assert finding.status == "pass"
+        assert finding.score == 100.0
+
+    def test_python_coverage_config_without_pytest_cov(self, tmp_path):
+        """Test partial score when only a coverage config file exists."""
+        (tmp_path / ".coveragerc").write_text("[run]\nbranch = True\n")
+
+        finding = TestCoverageAssessor().assess(_make_repo(tmp_path))
+
+        assert finding.score == 50.0
+        assert "Coverage config: ✓" in finding.evidence
+        assert "pytest-cov: ✗" in finding.evidence
+
+    def test_python_coverage_missing(self, tmp_path):
+        """Test zero score without any coverage configuration."""
+        finding = TestCoverageAssessor().assess(_make_repo(tmp_path))
+
+        assert finding.score == 0.0
+        assert finding.evidence == ["No coverage configuration found"]
+
+    def test_pytest_cov_only_counted_in_dependency_tables(self, tmp_path):
+        """Test that comments and unrelated tables don't count as pytest-cov."""
+        (tmp_path / "pyproject.toml").write_text(
+            "# TODO: add pytest-cov\n"
+            "[project]\n"
+            'dependencies = ["pytest-cov-extra>=1.0"]\n'
+            "[tool.notes]\n"
+            'text = "pytest-cov"\n'
+        )
+
+        finding = TestCoverageAssessor().assess(_make_repo(tmp_path))
+
+        assert "pytest-cov: ✗" in finding.evidence
+
+    def test_declares_dependency_across_tool_tables(self):
+        """Test dependency lookups in PEP 735 groups and tool tables."""
+        assessor = TestCoverageAssessor()
+        documents = [
+            {"dependency-groups": {"test": [{"include-group": "x"}, "Pytest_Cov"]}},
+            {
+                "tool": {
+                    "poetry": {"group": {"dev": {"dependencies": {"pytest-cov": "*"}}}}
+                }
+            },
+            {
+                "tool": {
+                    "uv": {"dev-dependencies": ["pytest-cov>=4; python_version>'3'"]}
+                }
+            },
+            {"tool": {"hatch": {"envs": {"test": {"dependencies": ["pytest-cov"]}}}}},
+            {
+                "tool": {
+                    "hatch": {
+                        "envs": {"cov": {"extra-dependencies": ["pytest-cov[toml]"]}}
+                    }
+                }
+            },
+        ]
+
+        for document in documents:
+            assert assessor._declares_dependency(document, "pytest-cov")
+        assert not assessor._declares_dependency({"project": {}}, "pytest-cov")
+
+    def test_malformed_dependency_tables_are_scored(self, tmp_path):
+        """Test that wrongly typed pyproject tables don't error the assessor."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\noptional-dependencies = ["a"]\n\n'
+            '[tool]\npoetry = "oops"\nhatch = {envs = ["x"]}\n\n'
+            "[tool.coverage.report]\nfail_under = 80\n"
+        )
+
+        finding = TestCoverageAssessor().assess(_make_repo(tmp_path))
+
+        assert finding.status == "fail"
+        assert finding.score == 50.0
+
+    def test_invalid_pyproject_is_ignored(self, tmp_path):
+        """Test that an unparseable pyproject.toml still counts as config."""
+        (tmp_path / "pyproject.toml").write_text("[project\npytest-cov\n")
+
+        finding = TestCoverageAssessor().assess(_make_repo(tmp_path))
+
+        assert finding.score == 50.0
+
+    def test_javascript_coverage_with_jest(self, tmp_path):
+        """Test that jest in devDependencies counts as coverage tooling."""
+        (tmp_path / "package.json").write_text('{"devDependencies": {"jest": "^29"}}')
+
+        finding = TestCoverageAssessor().assess(
+            _make_repo(tmp_path, languages={"JavaScript": 10})
+        )
+
+        assert finding.status == "pass"
+
+    def test_applicable_only_with_test_directory(self, tmp_path):
+        """Test that applicability comes from the root test directories."""
+        repo = _make_repo(tmp_path)
+        assert not TestCoverageAssessor().is_applicable(repo)
+
+        (tmp_path / "spec").mkdir()
+        repo = _make_repo(tmp_path)
+        assert TestCoverageAssessor().is_applicable(repo)
+
+
+class TestPreCommitHooksAssessor:
+    """Test PreCommitHooksAssessor."""
+
+    def test_passes_with_precommit_config(self, tmp_path):
+        """Test pass when .pre-commit-config.yaml is at the root."""
+        (tmp_path / ".pre-commit-config.yaml").write_text("repos: []\n")
+
+        finding = PreCommitHooksAssessor().assess(_make_repo(tmp_path))
+
+        assert finding.status == "pass"
+
+    def test_fails_without_precommit_config(self, tmp_path):
+        """Test fail when no pre-commit config exists."""
+        finding = PreCommitHooksAssessor().assess(_make_repo(tmp_path))
+
+        assert finding.status == "fail"
+        assert finding.remediation is not None
+
+    def test_remediation_is_shared_and_immutable(self, tmp_path):
+        """Test that failing findings reuse one remediation that can't be edited."""
+        first = PreCommitHooksAssessor().assess(_make_repo(tmp_path))
+        second = PreCommitHooksAssessor().assess(_make_repo(tmp_path))
+
+        assert first.remediation is second.remediation
+        with pytest.raises(AttributeError):
+            first.remediation.steps.append("Extra step")
+
+    def test_attribute_is_shared(self):
+        """Test that the attribute is built once per class, not per access."""
+        assessor = PreCommitHooksAssessor()
+
+        assert assessor.attribute is PreCommitHooksAssessor().attribute
+        assert assessor.attribute.id == assessor.attribute_id
+        assert assessor.attribute.tier == assessor.tier
@@ -1,5 +1,6 @@
 """Unit tests for batch assessment models."""
 
+import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -334,3 +335,78 @@ class TestBatchAssessment:
         assert data["batch_id"] == "test-batch"
         assert len(data["results"]) == 1
         assert "summary" in data
+
+    def test_to_dict_without_results(self, sample_assessment):
+        """Test that results can be left out for streaming serialization."""
+        batch = BatchAssessment(
+            batch_id="test-batch",
+            timestamp=datetime.now(),
+            results=[
+                RepositoryResult(
+                    repository_url="https://github.com/user/repo1",
+                    assessment=sample_assessment,
+                )
+            ],
+            summary=BatchSummary(
+                total_repositories=1,
+                successful_assessments=1,
+                failed_assessments=0,
+                average_score=sample_assessment.overall_score,
+            ),
+            total_duration_seconds=10.0,
+        )
+
+        data = batch.to_dict(include_results=False)
+
+        assert data["results"] == []
+        assert list(data) == list(batch.to_dict())
+
+
+class TestAggregatedJSONReporter:
+    """Test streamed aggregated JSON output."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_matches_full_serialization(
+        self, sample_assessment, tmp_path, monkeypatch, use_orjson
+    ):
+        """Test that streaming results produces the same document as to_dict."""
+        from agentready.reporters import aggregated_json
+        from agentready.utils import fast_json
+
+        if use_orjson and not fast_json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", use_orjson)
+
+        results = [
+            RepositoryResult(
+                repository_url="https://github.com/user/repo1",
+                assessment=sample_assessment,
+            ),
+            RepositoryResult(
+                repository_url="https://github.com/user/repo2",
+                assessment=None,
+                error="Clone failed:\nnetwork unreachable ✗",
+                error_type="clone_error",
+            ),
+        ]
+        batch = BatchAssessment(
+            batch_id="test-batch",
+            timestamp=datetime.now(),
+            results=results,
+            summary=BatchSummary(
+                total_repositories=2,
+                successful_assessments=1,
+                failed_assessments=1,
+                average_score=sample_assessment.overall_score,
+                score_distribution={"Gold": 1},
+            ),
+            total_duration_seconds=10.0,
+        )
+        output = tmp_path / "all-assessments.json"
+
+        aggregated_json.AggregatedJSONReporter().generate(batch, output)
+
+        expected = json.dumps(
+            batch.to_dict(), indent=2, default=str, ensure_ascii=False
+        )
+        assert output.read_bytes() == expected.encode("utf-8")
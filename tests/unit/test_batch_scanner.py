@@ -0,0 +1,69 @@
+"""Unit tests for BatchScanner."""
+
+import sqlite3
+import subprocess
+
+from agentready.assessors.documentation import READMEAssessor
+from agentready.assessors.structure import StandardLayoutAssessor
+from agentready.services.batch_scanner import BatchScanner
+
+
+def _make_git_repo(path):
+    path.mkdir()
+    (path / "README.md").write_text(f"# {path.name}\n\n## Installation\n")
+    (path / "main.py").write_text("x = 1\n")
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+    subprocess.run(git + ["init"], cwd=path, capture_output=True, check=True)
+    subprocess.run(git + ["add", "."], cwd=path, capture_output=True, check=True)
+    subprocess.run(
+        git + ["commit", "-m", "init"], cwd=path, capture_output=True, check=True
+    )
+    return str(path)
+
+
+class TestBatchScannerJobs:
+    """Test serial and process-pool batch scans."""
+
+    def test_parallel_scan_matches_serial_in_input_order(self, tmp_path):
+        """Test that jobs > 1 gives the same results, in input order."""
+        urls = [_make_git_repo(tmp_path / name) for name in ("alpha", "beta")]
+        urls.append(str(tmp_path / "missing"))
+        assessors = [READMEAssessor(), StandardLayoutAssessor()]
+
+        progress = []
+        serial = BatchScanner(cache_dir=tmp_path / "cache1").scan_batch(
+            urls, assessors, use_cache=False
+        )
+        parallel = BatchScanner(cache_dir=tmp_path / "cache2").scan_batch(
+            urls,
+            assessors,
+            use_cache=False,
+            progress_callback=lambda current, total: progress.append(current),
+            jobs=2,
+        )
+
+        assert [r.repository_url for r in parallel.results] == urls
+        assert [r.is_success() for r in parallel.results] == [True, True, False]
+        for s, p in zip(serial.results[:2], parallel.results[:2]):
+            assert p.assessment.overall_score == s.assessment.overall_score
+            assert [f.score for f in p.assessment.findings] == [
+                f.score for f in s.assessment.findings
+            ]
+        assert parallel.results[2].error_type == serial.results[2].error_type
+        assert progress == [1, 2, 3]
+
+    def test_parallel_workers_share_cache_dir(self, tmp_path):
+        """Test that two workers can write to the same assessment cache."""
+        urls = [_make_git_repo(tmp_path / name) for name in ("alpha", "beta", "gamma")]
+        scanner = BatchScanner(cache_dir=tmp_path / "cache")
+
+        batch = scanner.scan_batch(
+            urls, [READMEAssessor(), StandardLayoutAssessor()], jobs=2
+        )
+
+        assert [r.is_success() for r in batch.results] == [True, True, True]
+        with sqlite3.connect(scanner.cache.db_path) as conn:
+            cached = conn.execute(
+                "SELECT repository_url FROM assessments ORDER BY repository_url"
+            ).fetchall()
+        assert [url for (url,) in cached] == sorted(urls)
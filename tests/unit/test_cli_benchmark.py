@@ -28,6 +28,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -372,6 +373,52 @@ class TestRunTbench:
                 skip_preflight=True,
             )
 
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("agentready.utils.preflight.check_harbor_cli")
+    def test_run_tbench_checks_api_key_before_preflight(
+        self, mock_check_harbor, tmp_path
+    ):
+        """Test a missing API key fails before Harbor preflight runs."""
+        with pytest.raises(click.exceptions.Abort):
+            _run_tbench(
+                repo_path=tmp_path,
+                subset="full",
+                agent="claude-code",
+                model="anthropic/claude-haiku-4-5",
+                verbose=False,
+                timeout=3600,
+                output_dir=None,
+                skip_preflight=False,
+            )
+
+        mock_check_harbor.assert_not_called()
+
+    @patch("agentready.cli.benchmark.tempfile.mkdtemp")
+    @patch("agentready.cli.benchmark._real_tbench_result")
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    def test_run_tbench_failure_removes_jobs_dir(
+        self, mock_result, mock_mkdtemp, tmp_path
+    ):
+        """Test a failed run doesn't leave its temp jobs dir behind."""
+        jobs_dir = tmp_path / "jobs"
+        jobs_dir.mkdir()
+        mock_mkdtemp.return_value = str(jobs_dir)
+        mock_result.side_effect = RuntimeError("Harbor command failed")
+
+        with pytest.raises(click.exceptions.Abort):
+            _run_tbench(
+                repo_path=tmp_path,
+                subset="full",
+                agent="claude-code",
+                model="anthropic/claude-haiku-4-5",
+                verbose=False,
+                timeout=3600,
+                output_dir=None,
+                skip_preflight=True,
+            )
+
+        assert not jobs_dir.exists()
+
     @patch("agentready.cli.benchmark._real_tbench_result")
     @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
     def test_run_tbench_defaults_to_full(
@@ -604,6 +651,22 @@ class TestValidateAssessorCommand:
         assert result.exit_code != 0
         assert "Error:" in result.output
 
+    @patch("agentready.cli.benchmark.compare_assessor_impact")
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    def test_validate_assessor_rejects_unknown_assessor_early(
+        self, mock_compare, runner
+    ):
+        """Test unknown assessors fail before any benchmark work starts."""
+        result = runner.invoke(
+            validate_assessor,
+            ["--assessor", "invalid_assessor", "--smoketest"],
+        )
+
+        assert result.exit_code != 0
+        assert "Unknown assessor 'invalid_assessor'" in result.output
+        assert "claude_md_file" in result.output
+        mock_compare.assert_not_called()
+
     @patch("agentready.cli.benchmark.compare_assessor_impact")
     @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
     def test_validate_assessor_creates_output_files(
@@ -656,6 +719,30 @@ class TestValidateAssessorCommand:
             _, kwargs = mock_compare.call_args
             assert kwargs["n_concurrent"] == 5
 
+    @patch("agentready.cli.benchmark.compare_assessor_impact")
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    def test_validate_assessor_concurrent_defaults_to_task_count(
+        self, mock_compare, runner, mock_comparison
+    ):
+        """Test that tasks run concurrently by default, capped at 8."""
+        mock_compare.return_value = mock_comparison
+
+        with runner.isolated_filesystem():
+            Path(".agentready/validations/claude_md_file").mkdir(
+                parents=True, exist_ok=True
+            )
+
+            result = runner.invoke(
+                validate_assessor,
+                ["--assessor", "claude_md_file", "-t", "task-a", "-t", "task-b"],
+            )
+            assert result.exit_code == 0
+            assert mock_compare.call_args.kwargs["n_concurrent"] == 2
+
+            result = runner.invoke(validate_assessor, ["--assessor", "claude_md_file"])
+            assert result.exit_code == 0
+            assert mock_compare.call_args.kwargs["n_concurrent"] == 8
+
 
 class TestPhase1Tasks:
     """Test DEFAULT_PHASE1_TASKS constant."""
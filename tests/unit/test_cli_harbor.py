@@ -312,6 +312,24 @@ class TestGenerateReports:
         assert "with_agent" in data
         assert "deltas" in data
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_output_same_with_and_without_orjson(
+        self, mock_comparison, tmp_path, monkeypatch, use_orjson
+    ):
+        """Test that the comparison JSON is byte-identical across encoders."""
+        from agentready.cli.harbor import _write_json
+        from agentready.utils import fast_json
+
+        if use_orjson and not fast_json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", use_orjson)
+        path = tmp_path / "comparison.json"
+
+        _write_json(mock_comparison, path)
+
+        expected = json.dumps(mock_comparison.to_dict(), indent=2, ensure_ascii=False)
+        assert path.read_bytes() == expected.encode("utf-8")
+
 
 class TestCreateLatestSymlinks:
     """Test _create_latest_symlinks helper function."""
@@ -624,6 +642,39 @@ class TestListComparisonsCommand:
         assert "Success Δ:" in result.output
         assert "Duration Δ:" in result.output
 
+    @patch("agentready.cli.harbor.generate_dashboard")
+    @patch("agentready.cli.harbor.generate_markdown_report")
+    def test_list_reads_index_and_unindexed_runs(
+        self, mock_markdown, mock_dashboard, runner, tmp_path, mock_comparison
+    ):
+        """Test that indexed runs skip the JSON parse and others still list."""
+        output_dir = tmp_path / "comparisons"
+        run_dir = output_dir / "run_20240102_120000"
+        run_dir.mkdir(parents=True)
+        paths = _generate_reports(
+            comparison=mock_comparison,
+            run_dir=run_dir,
+            output_dir=output_dir,
+            timestamp="20240102_120000",
+        )
+        assert (output_dir / "index.jsonl").exists()
+        # Listing an indexed run must not need to parse its comparison file
+        paths["json"].write_text("not json")
+
+        legacy_dir = output_dir / "run_20240101_120000"
+        legacy_dir.mkdir()
+        (legacy_dir / "comparison_20240101_120000.json").write_text(
+            json.dumps(mock_comparison.to_dict())
+        )
+
+        result = runner.invoke(list_comparisons, ["--output-dir", str(output_dir)])
+
+        assert result.exit_code == 0
+        assert result.output.index("run_20240102_120000") < result.output.index(
+            "run_20240101_120000"
+        )
+        assert result.output.count("Success Δ:") == 2
+
     def test_list_nonexistent_directory(self, runner, tmp_path):
         """Test list command with nonexistent directory."""
         result = runner.invoke(
@@ -110,7 +110,9 @@ class TestLargeRepositoryWarnings:
         with patch("agentready.cli.main.safe_subprocess_run") as mock_safe_run:
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = "\n".join([f"file{i}.py" for i in range(10001)])
+            mock_result.stdout = b"".join(
+                f"file{i}.py\0".encode() for i in range(10001)
+            )
             mock_safe_run.return_value = mock_result
 
             # Run without confirmation (should abort)
@@ -139,7 +141,7 @@ class TestLargeRepositoryWarnings:
         with patch("agentready.cli.main.safe_subprocess_run") as mock_safe_run:
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = "\n".join([f"file{i}.py" for i in range(100)])
+            mock_result.stdout = b"".join(f"file{i}.py\0".encode() for i in range(100))
             mock_safe_run.return_value = mock_result
 
             # Run assessment
@@ -192,10 +194,10 @@ class TestLargeRepositoryWarnings:
 
         def selective_mock(*args, **kwargs):
             # Fail for git ls-files in the file count check (has timeout=5)
-            if args[0] == ["git", "ls-files"] and kwargs.get("timeout") == 5:
+            if args[0] == ["git", "ls-files", "-z"] and kwargs.get("timeout") == 5:
                 mock_result = MagicMock()
                 mock_result.returncode = 1
-                mock_result.stdout = ""
+                mock_result.stdout = b""
                 return mock_result
             # Let all other calls through to real implementation
             return original_safe_run(*args, **kwargs)
@@ -239,7 +241,9 @@ class TestCombinedValidations:
             with patch("agentready.cli.main.safe_subprocess_run") as mock_safe_run:
                 mock_result = MagicMock()
                 mock_result.returncode = 0
-                mock_result.stdout = "\n".join([f"file{i}.py" for i in range(10001)])
+                mock_result.stdout = b"".join(
+                    f"file{i}.py\0".encode() for i in range(10001)
+                )
                 mock_safe_run.return_value = mock_result
 
                 # Run without confirmation (should abort on first warning)
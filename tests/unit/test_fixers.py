@@ -116,6 +116,19 @@ def test_claude_md_command_shell_safe():
     assert "'" in cmd or '"' in cmd  # shlex.quote applied
 
 
+def test_claude_md_command_reads_prompt_once():
+    """_claude_md_command builds the command once and reuses it."""
+    _claude_md_command.cache_clear()
+    with patch(
+        "agentready.fixers.documentation.load_prompt", return_value="prompt"
+    ) as mock_load:
+        first = _claude_md_command()
+        assert _claude_md_command() is first
+    _claude_md_command.cache_clear()
+
+    mock_load.assert_called_once_with("claude_md_generator")
+
+
 class TestCLAUDEmdFixer:
     """Tests for CLAUDEmdFixer."""
 
@@ -341,6 +354,18 @@ class TestGitignoreFixer:
         assert "# AgentReady recommended patterns" in content
         assert "__pycache__/" in content
 
+    def test_template_read_once(self, temp_repo, gitignore_failing_finding):
+        """Test that fixes share one read of the template but own their lists."""
+        fixer = GitignoreFixer()
+        first = fixer.generate_fix(temp_repo, gitignore_failing_finding)
+
+        with patch.object(Path, "read_text") as mock_read:
+            second = fixer.generate_fix(temp_repo, gitignore_failing_finding)
+
+        mock_read.assert_not_called()
+        assert second.additions == first.additions
+        assert second.additions is not first.additions
+
 
 @pytest.fixture
 def precommit_hooks_failing_finding():
@@ -1,6 +1,8 @@
 """Unit tests for Harbor services."""
 
 import json
+import subprocess
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +12,7 @@ from agentready.services.harbor.result_parser import (
     parse_harbor_results,
     parse_single_result,
 )
+from agentready.services.harbor.runner import HarborRunner
 
 
 class TestAgentFileToggler:
@@ -253,3 +256,72 @@ class TestResultParser:
         assert len(results) == 1
         assert results[0].task_name == "task1"
         assert results[0].success is False  # No agent/verifier results
+
+
+class TestHarborRunner:
+    """Tests for HarborRunner.run_benchmark."""
+
+    @pytest.fixture
+    def harbor_runner(self):
+        """Create a runner without checking for a Harbor installation."""
+        with (
+            patch.object(HarborRunner, "_verify_harbor_installed"),
+            patch.object(HarborRunner, "_check_harbor_task_filtering"),
+        ):
+            return HarborRunner()
+
+    def test_run_benchmark_returns_job_directory(self, harbor_runner, tmp_path):
+        """Test that the Harbor command is built and its job dir returned."""
+        output_dir = tmp_path / "without_agent"
+
+        def fake_run(cmd, cwd, **kwargs):
+            (output_dir / "2025-12-09__10-00-00").mkdir()
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        with patch(
+            "agentready.services.harbor.runner.subprocess.run", side_effect=fake_run
+        ) as mock_run:
+            results_dir = harbor_runner.run_benchmark(
+                task_names=["task-a", "task-b"],
+                output_dir=output_dir,
+                model="anthropic/claude-sonnet-4-5",
+                verbose=False,
+            )
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[:2] == ["harbor", "run"]
+        assert cmd[-4:] == ["-t", "task-a", "-t", "task-b"]
+        assert mock_run.call_args.kwargs["cwd"] == str(output_dir)
+        assert results_dir == output_dir / "2025-12-09__10-00-00"
+
+    def test_run_benchmark_failure_raises(self, harbor_runner, tmp_path):
+        """Test that a non-zero Harbor exit raises with its stderr."""
+        error = subprocess.CalledProcessError(2, ["harbor"], stderr="boom")
+
+        with (
+            patch(
+                "agentready.services.harbor.runner.subprocess.run", side_effect=error
+            ),
+            pytest.raises(subprocess.CalledProcessError) as exc_info,
+        ):
+            harbor_runner.run_benchmark(
+                task_names=["task-a"], output_dir=tmp_path, verbose=False
+            )
+
+        assert exc_info.value.returncode == 2
+        assert exc_info.value.stderr == "Harbor benchmark failed: boom"
+
+    def test_run_benchmark_without_results_raises(self, harbor_runner, tmp_path):
+        """Test that a run leaving no job directory is reported."""
+        completed = subprocess.CompletedProcess(["harbor"], 0, stdout="", stderr="")
+
+        with (
+            patch(
+                "agentready.services.harbor.runner.subprocess.run",
+                return_value=completed,
+            ),
+            pytest.raises(ValueError, match="No results found"),
+        ):
+            harbor_runner.run_benchmark(
+                task_names=["task-a"], output_dir=tmp_path / "out", verbose=False
+            )
@@ -1,5 +1,6 @@
 """Unit tests for data models."""
 
+import pickle
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -80,6 +81,76 @@ class TestRepository:
         assert data["name"] == "test"
         assert data["languages"] == {"Python": 5}
 
+    def test_repository_top_level_dirs(self, tmp_path):
+        """Test top-level directory names are scanned once and cached."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "src").mkdir()
+        (tmp_path / "test").mkdir()
+        (tmp_path / "docs").write_text("not a directory")
+
+        repo = Repository(
+            path=tmp_path,
+            name="test",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={},
+            total_files=0,
+            total_lines=0,
+        )
+
+        assert repo.top_level_dirs == frozenset({".git", "src", "test"})
+
+        (tmp_path / "tests").mkdir()
+        assert "tests" not in repo.top_level_dirs
+
+    def test_repository_python_files_and_readme_text(self, tmp_path):
+        """Test shared Python file walk and normalized README text."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "core.py").write_text("x = 1\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.py").write_text("x = 1\n")
+        (tmp_path / "README.md").write_bytes(b"# Title\r\nBody\r")
+
+        repo = Repository(
+            path=tmp_path,
+            name="test",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={},
+            total_files=0,
+            total_lines=0,
+        )
+
+        assert [entry.name for entry in repo.python_files] == ["core.py"]
+        assert repo.readme_text == "# Title\nBody\n"
+        assert repo.path_str == str(tmp_path)
+
+    def test_repository_pickles_without_cached_scans(self, tmp_path):
+        """Test that cached DirEntry scans are dropped when pickling."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "main.py").write_text("x = 1\n")
+
+        repo = Repository(
+            path=tmp_path,
+            name="test",
+            url=None,
+            branch="main",
+            commit_hash="abc123",
+            languages={"Python": 1},
+            total_files=1,
+            total_lines=1,
+        )
+        assert len(repo.python_files) == 1
+
+        restored = pickle.loads(pickle.dumps(repo))
+
+        assert restored == repo
+        assert "python_files" not in vars(restored)
+        assert [entry.name for entry in restored.python_files] == ["main.py"]
+
 
 class TestAttribute:
     """Test Attribute model."""
@@ -192,6 +263,24 @@ class TestFinding:
         assert finding.remediation is not None
         assert len(finding.remediation.steps) == 2
 
+    def test_finding_models_use_slots(self):
+        """Test that findings and remediations carry no per-instance __dict__."""
+        remediation = Remediation(
+            summary="Fix the issue",
+            steps=["Step 1"],
+            tools=[],
+            commands=[],
+            examples=[],
+            citations=[
+                Citation(source="Docs", title="Guide", url=None, relevance="How")
+            ],
+        )
+
+        assert not hasattr(remediation, "__dict__")
+        assert not hasattr(remediation.citations[0], "__dict__")
+        with pytest.raises(AttributeError):
+            remediation.extra = "value"
+
     def test_finding_invalid_status(self):
         """Test finding with invalid status."""
         attr = Attribute(
@@ -0,0 +1,50 @@
+"""Unit tests for the optional-orjson JSON helpers."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from agentready.utils import fast_json
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run a test with orjson and with the standard library fallback."""
+    if request.param and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestDumpsIndented:
+    """Test indented JSON encoding."""
+
+    def test_matches_json_dumps_bytes(self, encoder):
+        """Test that both encoders produce json.dumps(indent=2) output."""
+        data = {"evidence": ["✓ README.md found"], "score": 82.5, 1: [], "x": {}}
+
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        assert fast_json.dumps_indented(data) == expected.encode("utf-8")
+
+    def test_datetimes_go_through_default(self, encoder):
+        """Test that datetimes are encoded by default, not natively."""
+        data = {"timestamp": datetime(2025, 1, 22, 14, 30, 22)}
+
+        assert fast_json.loads(fast_json.dumps_indented(data, default=str)) == {
+            "timestamp": "2025-01-22 14:30:22"
+        }
+
+
+class TestLoads:
+    """Test JSON decoding."""
+
+    def test_parses_bytes_and_str(self, encoder):
+        """Test that bytes and str documents parse the same."""
+        assert fast_json.loads(b'{"name": "d\xc3\xa9mo"}') == {"name": "démo"}
+        assert fast_json.loads('{"name": "démo"}') == {"name": "démo"}
+
+    def test_invalid_json_raises_json_decode_error(self, encoder):
+        """Test that malformed input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            fast_json.loads(b"{not json")
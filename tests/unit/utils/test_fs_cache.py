@@ -0,0 +1,59 @@
+"""Unit tests for the per-repository filesystem cache."""
+
+from unittest.mock import patch
+
+from agentready.utils.fs_cache import FSCache
+
+
+class TestFSCacheExists:
+    """Test memoized existence checks."""
+
+    def test_exists_matches_path_exists(self, tmp_path):
+        """Test existing files, directories and missing paths."""
+        (tmp_path / "file.txt").write_text("x")
+        (tmp_path / "dir").mkdir()
+        cache = FSCache()
+
+        assert cache.exists(tmp_path / "file.txt")
+        assert cache.exists(tmp_path / "dir")
+        assert cache.exists(str(tmp_path / "dir"))
+        assert not cache.exists(tmp_path / "missing")
+
+    def test_exists_is_memoized(self, tmp_path):
+        """Test that repeated probes of one path hit the filesystem once."""
+        cache = FSCache()
+
+        with patch(
+            "agentready.utils.fs_cache.os.path.exists", return_value=True
+        ) as mock_exists:
+            assert cache.exists(tmp_path / "README.md")
+            assert cache.exists(tmp_path / "README.md")
+
+        mock_exists.assert_called_once_with(str(tmp_path / "README.md"))
+
+
+class TestFSCacheListdir:
+    """Test cached directory listings."""
+
+    def test_listdir_returns_entries_by_name(self, tmp_path):
+        """Test that entries are keyed by name and carry type information."""
+        (tmp_path / "a.md").write_text("x")
+        (tmp_path / "sub").mkdir()
+
+        listing = FSCache().listdir(tmp_path)
+
+        assert set(listing) == {"a.md", "sub"}
+        assert listing["sub"].is_dir()
+
+    def test_listdir_missing_directory_is_empty(self, tmp_path):
+        """Test that a missing directory lists as empty."""
+        assert FSCache().listdir(tmp_path / "missing") == {}
+
+    def test_listdir_is_cached(self, tmp_path):
+        """Test that later changes are not seen by the same cache."""
+        cache = FSCache()
+        first = cache.listdir(tmp_path)
+        (tmp_path / "new.txt").write_text("x")
+
+        assert cache.listdir(tmp_path) is first
+        assert "new.txt" not in cache.listdir(tmp_path)
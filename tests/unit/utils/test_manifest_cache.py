@@ -0,0 +1,96 @@
+"""Unit tests for the process-wide manifest cache."""
+
+import json
+import os
+
+import pytest
+
+from agentready.utils.manifest_cache import (
+    load_package_json,
+    load_pyproject,
+    read_manifest_text,
+)
+
+
+class TestReadManifestText:
+    """Test cached manifest reads."""
+
+    def test_reads_file_once_until_modified(self, tmp_path):
+        """Test that unchanged files are served from cache and edits are seen."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "a"\n')
+
+        first = read_manifest_text(pyproject)
+        assert read_manifest_text(str(pyproject)) is first
+
+        pyproject.write_text('[project]\nname = "changed"\n')
+        st = pyproject.stat()
+        os.utime(pyproject, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert "changed" in read_manifest_text(pyproject)
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing manifest raises OSError."""
+        with pytest.raises(OSError):
+            read_manifest_text(tmp_path / "pyproject.toml")
+
+
+class TestLoadPackageJson:
+    """Test cached package.json parsing."""
+
+    def test_parses_and_caches(self, tmp_path):
+        """Test that package.json is parsed once per version of the file."""
+        package_json = tmp_path / "package.json"
+        package_json.write_text(json.dumps({"devDependencies": {"jest": "^29"}}))
+
+        pkg = load_package_json(package_json)
+
+        assert pkg == {"devDependencies": {"jest": "^29"}}
+        assert load_package_json(package_json) is pkg
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_parses_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson):
+        """Test that both JSON parsers give the same document."""
+        from agentready.utils import fast_json
+
+        if use_orjson and not fast_json.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", use_orjson)
+        package_json = tmp_path / "package.json"
+        package_json.write_bytes(
+            b'\xef\xbb\xbf{"name": "d\xc3\xa9mo", "scripts": {"test": "jest"}}'
+        )
+
+        assert load_package_json(package_json) == {
+            "name": "démo",
+            "scripts": {"test": "jest"},
+        }
+
+    def test_parses_utf8_bom(self, tmp_path):
+        """Test that a leading UTF-8 BOM doesn't break parsing."""
+        package_json = tmp_path / "package.json"
+        package_json.write_bytes(b'\xef\xbb\xbf{"name": "demo"}')
+
+        assert load_package_json(package_json) == {"name": "demo"}
+
+    def test_invalid_json_raises(self, tmp_path):
+        """Test that malformed JSON raises JSONDecodeError."""
+        package_json = tmp_path / "package.json"
+        package_json.write_text("{not json")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_package_json(package_json)
+
+
+class TestLoadPyproject:
+    """Test cached pyproject.toml parsing."""
+
+    def test_parses_and_caches(self, tmp_path):
+        """Test that pyproject.toml is parsed once per version of the file."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "demo"\n')
+
+        data = load_pyproject(pyproject)
+
+        assert data == {"project": {"name": "demo"}}
+        assert load_pyproject(pyproject) is data